@@ -15,6 +15,7 @@ from typing import Dict, List, Optional, Set, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+import orjson
 import websockets
 from websockets.server import WebSocketServerProtocol
 
@@ -123,6 +124,9 @@ class CloudOrchestrator:
         self._health_check_task: Optional[asyncio.Task] = None
         self._stats_update_task: Optional[asyncio.Task] = None
         
+        # Set once the WebSocket server is listening
+        self.ready = asyncio.Event()
+
     async def start_server(self):
         """Start the Cloud Orchestrator WebSocket server."""
         self.logger.info(f"Starting Cloud Orchestrator on {self.host}:{self.port}")
@@ -148,6 +152,7 @@ class CloudOrchestrator:
         ):
             self.logger.info("Cloud Orchestrator server started")
             self.system_health.status = ServiceStatus.HEALTHY
+            self.ready.set()
             await self._emit_event("server_started", {"timestamp": time.time()})
             
             # Keep server running
@@ -868,23 +873,46 @@ class CloudOrchestrator:
         except Exception as e:
             self.logger.error(f"Failed to send system state to client {client_id}: {e}")
     
+    def _serialize_message(self, message: Dict) -> str:
+        """
+        Encode an outgoing message as a JSON text frame.
+
+        Messages orjson rejects (integers beyond 64 bits, non-str keys) fall
+        back to the json module, which raises for anything it cannot encode.
+        """
+        # Debug: Log JSON serialization for blockchain data
+        if message.get("type") == "blockchain_data_update":
+            self.logger.debug(
+                f"JSON SERIALIZING base_fee_gwei: {message.get('blockchain_data', {}).get('base_fee_gwei', 'MISSING')}"
+            )
+
+        try:
+            return orjson.dumps(message).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(message)
+
     async def _send_to_client(self, client_id: str, message: Dict):
         """Send message to specific client."""
+        if client_id not in self.clients:
+            return
+
+        try:
+            message_json = self._serialize_message(message)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to serialize message for client {client_id}: {e}"
+            )
+            return
+
+        await self._send_serialized(client_id, message_json)
+
+    async def _send_serialized(self, client_id: str, message_json: str):
+        """Send an already-encoded message to specific client."""
         client = self.clients.get(client_id)
         if not client:
             return
         
         try:
-            # Debug: Log JSON serialization for blockchain data
-            if message.get('type') == 'blockchain_data_update':
-                self.logger.debug(f"JSON SERIALIZING base_fee_gwei: {message.get('blockchain_data', {}).get('base_fee_gwei', 'MISSING')}")
-                message_json = json.dumps(message)
-                # Parse it back to verify
-                parsed = json.loads(message_json)
-                self.logger.debug(f"JSON PARSED BACK base_fee_gwei: {parsed.get('blockchain_data', {}).get('base_fee_gwei', 'MISSING')}")
-            else:
-                message_json = json.dumps(message)
-            
             await client.websocket.send(message_json)
         except Exception as e:
             self.logger.warning(f"Failed to send to client {client_id}: {e}")
@@ -895,14 +923,28 @@ class CloudOrchestrator:
         if session_id not in self.client_sessions:
             return
         
-        for client_id in self.client_sessions[session_id]:
+        # Encode once and share the same frame across the fanout
+        try:
+            message_json = self._serialize_message(message)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to serialize message for session {session_id}: {e}"
+            )
+            return
+        for client_id in list(self.client_sessions[session_id]):
             if client_id != exclude:
-                await self._send_to_client(client_id, message)
+                await self._send_serialized(client_id, message_json)
     
     async def _broadcast_to_all(self, message: Dict):
         """Broadcast message to all connected clients."""
-        for client_id in self.clients:
-            await self._send_to_client(client_id, message)
+        # Encode once and share the same frame across the fanout
+        try:
+            message_json = self._serialize_message(message)
+        except Exception as e:
+            self.logger.warning(f"Failed to serialize broadcast message: {e}")
+            return
+        for client_id in list(self.clients):
+            await self._send_serialized(client_id, message_json)
     
     async def _send_error(self, client_id: str, error_message: str):
         """Send error message to client."""
@@ -58,8 +58,11 @@ def save_last_motor_states(motor_states):
     try:
         import json
         states_file = Path(__file__).parent / "last_motor_states.json"
-        with open(states_file, 'w') as f:
-            json.dump(motor_states, f, indent=2)
+        # Write to a sibling temp file and swap it in so readers never see a partial file
+        tmp_file = states_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            f.write(json.dumps(motor_states, indent=2))
+        os.replace(tmp_file, states_file)
         print(f"   Saved motor states for transition: {len(motor_states)} motors")
     except Exception as e:
         print(f"   Error saving motor states: {e}")
@@ -72,8 +75,8 @@ def start_visual_motor_server():
     process = subprocess.Popen(
         [sys.executable, "tools/mock_motor_tcp_gui.py"],
         cwd=Path(__file__).parent,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     
     print(f"   Visual Motor Server started (PID: {process.pid})")
@@ -9,26 +9,54 @@ compatibility with the complete local development system.
 import asyncio
 import logging
 import os
+import queue
+import re
 import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+import orjson
+
+from cloud.data_aggregator.data_processor import DataProcessor
+from cloud.orchestrator.cloud_orchestrator import CloudOrchestrator
+
+
+def configure_logging():
+    """Route log records through a queue so the event loop never blocks on stderr."""
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    # Background thread performs the actual stderr writes
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
 # Configure logging for production
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+log_listener = configure_logging()
 logger = logging.getLogger(__name__)
 
+# KEY=value assignments; blank lines and comments never match
+ENV_LINE_PATTERN = re.compile(r"^\s*([A-Za-z_]\w*)\s*=\s*(.*?)\s*$")
+
+
 def load_env_file():
     """Load environment variables from .env file if it exists."""
     env_file = Path(__file__).parent / ".env"
     if env_file.exists():
         with open(env_file, 'r') as f:
+            parsed = {}
             for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+                match = ENV_LINE_PATTERN.match(line)
+                if match:
+                    parsed[match[1]] = match[2]
+        os.environ.update(parsed)
                     
 load_env_file()
 
@@ -57,10 +85,12 @@ def get_system_mode():
 def save_last_motor_states(motor_states):
     """Save last motor states for smooth transitions."""
     try:
-        import json
         states_file = Path(__file__).parent / "last_motor_states.json"
-        with open(states_file, 'w') as f:
-            json.dump(motor_states, f, indent=2)
+        # Write to a sibling temp file and swap it in so readers never see a partial file
+        tmp_file = states_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(motor_states, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, states_file)
         logger.info(f"Saved motor states for transition: {len(motor_states)} motors")
     except Exception as e:
         logger.error(f"Error saving motor states: {e}")
@@ -69,8 +99,6 @@ async def start_cloud_orchestrator():
     """Start the cloud orchestrator for production."""
     logger.info("Starting Cloud Orchestrator for Railway deployment...")
     
-    from cloud.orchestrator.cloud_orchestrator import CloudOrchestrator
-    
     global cloud_orchestrator_instance
     
     # Get port from Railway environment or default
@@ -80,17 +108,22 @@ async def start_cloud_orchestrator():
     cloud_orchestrator_instance = CloudOrchestrator(host=host, port=port)
     orchestrator_task = asyncio.create_task(cloud_orchestrator_instance.start_server())
     
+    # Wait until the port is bound, surfacing startup failures immediately
+    ready_task = asyncio.create_task(cloud_orchestrator_instance.ready.wait())
+    await asyncio.wait(
+        {orchestrator_task, ready_task}, return_when=asyncio.FIRST_COMPLETED
+    )
+    if orchestrator_task.done():
+        ready_task.cancel()
+        orchestrator_task.result()
+
     logger.info(f"Cloud Orchestrator started on {host}:{port}")
     return orchestrator_task
 
-async def start_blockchain_service():
-    """Start blockchain data processing for production."""
+async def start_blockchain_service(orchestrator: CloudOrchestrator):
+    """Start blockchain data processing for production, broadcasting via orchestrator."""
     logger.info("Starting Blockchain Data Service...")
     
-    from cloud.data_aggregator.data_processor import DataProcessor
-    import socket
-    import json
-    
     # Check if API usage is authorized
     api_auth_key = os.environ.get('DRAWING_MACHINE_API_KEY', '')
     if not api_auth_key:
@@ -107,47 +140,46 @@ async def start_blockchain_service():
     # Event-driven blockchain processing callback
     async def on_new_block(block_number: int):
         """Handle new block events from WebSocket subscription."""
+        mode = get_system_mode()
+        if mode != "auto":
+            logger.debug(f"System in manual mode, ignoring block {block_number}")
+            return
+
+        logger.info(f"🔥 Processing new block: {block_number}")
+
+        # Process blockchain data (force refresh to bypass cache)
         try:
-            mode = get_system_mode()
-            if mode != "auto":
-                logger.debug(f"System in manual mode, ignoring block {block_number}")
-                return
-            
-            logger.info(f"🔥 Processing new block: {block_number}")
-            
-            # Process blockchain data (force refresh to bypass cache)
             result = await processor.process_current_data(force_refresh=True)
-            
+        except Exception as e:
+            logger.error(f"Blockchain processing error: {e}")
+            return
+
+        # Build and broadcast the update; this runs as a fire-and-forget task,
+        # so anything not logged here is lost
+        try:
             if result and result.motors:
                 # Use the SAME blockchain data for both motor commands and display
                 # This ensures perfect consistency between calculated RPMs and displayed metrics
                 source_data = result.source_data
                 
                 if source_data:
-                    # Convert motor commands to execution format
-                    motor_commands = {}
+                    # Build transition and frontend motor formats in a single pass
+                    motor_states = {}
+                    frontend_commands = {}
                     for motor_name, motor_cmd in result.motors.items():
-                        motor_commands[motor_name] = {
-                            "velocity_rpm": motor_cmd.velocity_rpm,
-                            "direction": motor_cmd.direction.value,
-                            "duration_seconds": getattr(motor_cmd, 'duration_seconds', 3.4)
+                        velocity_rpm = motor_cmd.velocity_rpm
+                        direction = motor_cmd.direction.value
+                        motor_states[motor_name] = {
+                            "rpm": velocity_rpm,
+                            "dir": direction,
+                        }
+                        frontend_commands[motor_name] = {
+                            "velocity_rpm": velocity_rpm,
+                            "direction": direction,
                         }
                     
                     # Use the SAME blockchain data that was used for motor calculation
-                    blob_util_for_motor = getattr(source_data, 'blob_space_utilization_percent', 0)
-                    logger.info(f"🔍 DEBUG: Motor calculation used blob_util={blob_util_for_motor}%")
-                    
-                    blockchain_data = {
-                        "eth_price_usd": getattr(source_data, 'eth_price_usd', 0),
-                        "gas_price_gwei": getattr(source_data, 'gas_price_gwei', 0),
-                        "base_fee_gwei": getattr(source_data, 'base_fee_gwei', 0),
-                        "blob_space_utilization_percent": blob_util_for_motor,
-                        "block_fullness_percent": getattr(source_data, 'block_fullness_percent', 0),
-                        "block_number": block_number,
-                        "epoch": getattr(source_data, 'epoch', 'N/A'),
-                        "data_sources": getattr(source_data, 'data_sources', {})
-                    }
-                    
+                    blockchain_data = source_data.to_broadcast_dict(block_number)
                     logger.info(f"🔍 DEBUG: Sending to frontend blob_util={blockchain_data['blob_space_utilization_percent']}%")
                     
                     # Calculate gas ratio for logging
@@ -160,49 +192,34 @@ async def start_blockchain_service():
                                    f"Gas={blockchain_data['gas_price_gwei']:.1f} gwei")
                     
                     # Save motor states for transitions
-                    motor_states = {}
-                    for motor_name, motor_data in motor_commands.items():
-                        motor_states[motor_name] = {
-                            "rpm": motor_data["velocity_rpm"],
-                            "dir": motor_data["direction"]
-                        }
                     save_last_motor_states(motor_states)
                     
                     # Broadcast to connected web clients
-                    if cloud_orchestrator_instance:
-                        try:
-                            # Convert for frontend
-                            frontend_commands = {}
-                            for motor_name, motor_data in motor_commands.items():
-                                frontend_commands[motor_name] = {
+                    try:
+                        # Broadcast blockchain data
+                        await orchestrator.broadcast_blockchain_data(
+                            blockchain_data, frontend_commands
+                        )
+
+                        # Update individual motor states
+                        for motor_name, motor_data in frontend_commands.items():
+                            await orchestrator.broadcast_motor_state_update(
+                                motor_name,
+                                {
                                     "velocity_rpm": motor_data["velocity_rpm"],
-                                    "direction": motor_data["direction"]
-                                }
-                            
-                            # Broadcast blockchain data
-                            await cloud_orchestrator_instance.broadcast_blockchain_data(
-                                blockchain_data, frontend_commands
+                                    "direction": motor_data["direction"],
+                                    "last_update": time.time(),
+                                    "is_enabled": True,
+                                    "source": "blockchain",
+                                },
                             )
-                            
-                            # Update individual motor states
-                            for motor_name, motor_data in frontend_commands.items():
-                                await cloud_orchestrator_instance.broadcast_motor_state_update(
-                                    motor_name, {
-                                        "velocity_rpm": motor_data["velocity_rpm"],
-                                        "direction": motor_data["direction"],
-                                        "last_update": time.time(),
-                                        "is_enabled": True,
-                                        "source": "blockchain"
-                                    }
-                                )
-                            
-                            logger.info("Broadcasted blockchain data to web clients")
-                            
-                        except Exception as e:
-                            logger.error(f"Failed to broadcast data: {e}")
-        
+
+                        logger.info("Broadcasted blockchain data to web clients")
+
+                    except Exception as e:
+                        logger.error(f"Failed to broadcast data: {e}")
         except Exception as e:
-            logger.error(f"Blockchain processing error: {e}")
+            logger.error(f"Blockchain update error for block {block_number}: {e}")
     
     # Start WebSocket block subscription
     logger.info("🚀 Starting WebSocket block subscription...")
@@ -231,9 +248,8 @@ async def main():
     try:
         # Start services
         orchestrator_task = await start_cloud_orchestrator()
-        await asyncio.sleep(2)  # Let orchestrator start
         
-        blockchain_task = await start_blockchain_service()
+        blockchain_task = await start_blockchain_service(cloud_orchestrator_instance)
         
         logger.info("✅ All production services started successfully!")
         logger.info(f"🌐 Server listening on port {os.environ.get('PORT', 8768)}")
@@ -254,4 +270,7 @@ async def main():
 
 if __name__ == "__main__":
     # Production server entry point
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    finally:
+        log_listener.stop()
@@ -12,6 +12,38 @@ import sys
 from pathlib import Path
 
 
+INSTRUCTIONS = """
+All backend services started successfully!
+
+To start the frontend:
+1. Open a new terminal/command prompt
+2. Navigate to the frontend directory:
+   cd frontend
+3. Install dependencies (if not done already):
+   npm install
+4. Start the development server:
+   npm run dev
+5. Open your browser to: http://localhost:5173
+6. Navigate to: Manual Control
+7. Click 'Connect' to connect to WebSocket server
+
+Demo Instructions:
+- Use sliders to control motor velocity
+- Click preset buttons for quick velocities
+- Test emergency stop functionality
+- Try recording and playing back sessions
+- Switch between control modes
+
+What to observe:
+- Real-time motor control via web interface
+- Motor states updating in real-time
+- Safety limits being enforced
+- Session recording and playback
+- TCP communication with mock motor server
+
+Press Ctrl+C to stop backend services"""
+
+
 async def start_mock_motor_server():
     """Start the mock motor TCP server."""
     print("Starting mock motor TCP server...")
@@ -20,8 +52,8 @@ async def start_mock_motor_server():
     process = await asyncio.create_subprocess_exec(
         sys.executable, "tools/mock_motor_tcp.py",
         cwd=Path(__file__).parent,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
     )
     
     print(f"   Mock motor server started (PID: {process.pid})")
@@ -61,34 +93,7 @@ async def main():
         manual_control_task = await start_manual_control_server()
         await asyncio.sleep(2)  # Let WebSocket server start
         
-        print("\nAll backend services started successfully!")
-        print("\nTo start the frontend:")
-        print("1. Open a new terminal/command prompt")
-        print("2. Navigate to the frontend directory:")
-        print("   cd frontend")
-        print("3. Install dependencies (if not done already):")
-        print("   npm install")
-        print("4. Start the development server:")
-        print("   npm run dev")
-        print("5. Open your browser to: http://localhost:5173")
-        print("6. Navigate to: Manual Control")
-        print("7. Click 'Connect' to connect to WebSocket server")
-        
-        print("\nDemo Instructions:")
-        print("- Use sliders to control motor velocity")
-        print("- Click preset buttons for quick velocities")
-        print("- Test emergency stop functionality")
-        print("- Try recording and playing back sessions")
-        print("- Switch between control modes")
-        
-        print("\nWhat to observe:")
-        print("- Real-time motor control via web interface")
-        print("- Motor states updating in real-time")
-        print("- Safety limits being enforced")
-        print("- Session recording and playback")
-        print("- TCP communication with mock motor server")
-        
-        print("\nPress Ctrl+C to stop backend services")
+        print(INSTRUCTIONS)
         
         # Keep running until interrupted
         await manual_control_task
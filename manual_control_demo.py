@@ -14,6 +14,28 @@ import time
 from pathlib import Path
 
 
+INSTRUCTIONS = """
+All services started successfully!
+
+Demo Instructions:
+1. Open your browser to: http://localhost:5173
+2. Navigate to: Manual Control
+3. Click 'Connect' to connect to WebSocket server
+4. Try controlling the motors with sliders and presets
+5. Test emergency stop functionality
+6. Record a session and play it back
+7. Switch between different control modes
+
+What to observe:
+- Real-time motor control via web interface
+- Motor states updating in real-time
+- Safety limits being enforced
+- Session recording and playback
+- TCP communication with mock motor server
+
+Press Ctrl+C to stop all services"""
+
+
 async def start_mock_motor_server():
     """Start the mock motor TCP server."""
     print("Starting mock motor TCP server...")
@@ -22,8 +44,8 @@ async def start_mock_motor_server():
     process = await asyncio.create_subprocess_exec(
         sys.executable, "tools/mock_motor_tcp.py",
         cwd=Path(__file__).parent,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
     )
     
     print(f"   Mock motor server started (PID: {process.pid})")
@@ -55,8 +77,8 @@ def start_frontend_dev_server():
     process = subprocess.Popen(
         ["npm", "run", "dev"],
         cwd=frontend_path,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     
     print(f"   Frontend dev server started (PID: {process.pid})")
@@ -86,24 +108,7 @@ async def main():
         frontend_process = start_frontend_dev_server()
         await asyncio.sleep(5)  # Let frontend start
         
-        print("\nAll services started successfully!")
-        print("\nDemo Instructions:")
-        print("1. Open your browser to: http://localhost:5173")
-        print("2. Navigate to: Manual Control")
-        print("3. Click 'Connect' to connect to WebSocket server")
-        print("4. Try controlling the motors with sliders and presets")
-        print("5. Test emergency stop functionality")
-        print("6. Record a session and play it back")
-        print("7. Switch between different control modes")
-        
-        print("\nWhat to observe:")
-        print("- Real-time motor control via web interface")
-        print("- Motor states updating in real-time")
-        print("- Safety limits being enforced")
-        print("- Session recording and playback")
-        print("- TCP communication with mock motor server")
-        
-        print("\nPress Ctrl+C to stop all services")
+        print(INSTRUCTIONS)
         
         # Keep running until interrupted
         await manual_control_task
@@ -14,6 +14,37 @@ import time
 from pathlib import Path
 
 
+INSTRUCTIONS = """
+All services started successfully!
+
+To start the frontend:
+1. Open a new terminal/command prompt
+2. Navigate to the frontend directory:
+   cd frontend
+3. Start the development server:
+   npm run dev
+4. Open your browser to: http://localhost:5173
+5. Navigate to: Manual Control
+6. Click 'Connect' to connect to WebSocket server
+
+Demo Instructions:
+- Use sliders to control motor velocity
+- WATCH THE GUI WINDOW for visual motor feedback!
+- Motor pointers rotate based on your controls
+- Colors change with activity levels
+- Command log shows real-time communication
+- Try presets, directions, and emergency stop
+
+What to observe:
+- Real-time motor visualization with rotating pointers
+- Color-coded activity levels (gray/green/orange/red)
+- Live command log scrolling
+- Server statistics updating
+- Instant response to web controls
+
+Press Ctrl+C to stop all services"""
+
+
 def start_gui_motor_server():
     """Start the GUI mock motor TCP server."""
     print("Starting GUI mock motor TCP server...")
@@ -63,33 +94,7 @@ async def main():
         manual_control_task = await start_manual_control_server()
         await asyncio.sleep(2)  # Let WebSocket server start
         
-        print("\nAll services started successfully!")
-        print("\nTo start the frontend:")
-        print("1. Open a new terminal/command prompt")
-        print("2. Navigate to the frontend directory:")
-        print("   cd frontend")
-        print("3. Start the development server:")
-        print("   npm run dev")
-        print("4. Open your browser to: http://localhost:5173")
-        print("5. Navigate to: Manual Control")
-        print("6. Click 'Connect' to connect to WebSocket server")
-        
-        print("\nDemo Instructions:")
-        print("- Use sliders to control motor velocity")
-        print("- WATCH THE GUI WINDOW for visual motor feedback!")
-        print("- Motor pointers rotate based on your controls")
-        print("- Colors change with activity levels")
-        print("- Command log shows real-time communication")
-        print("- Try presets, directions, and emergency stop")
-        
-        print("\nWhat to observe:")
-        print("- Real-time motor visualization with rotating pointers")
-        print("- Color-coded activity levels (gray/green/orange/red)")
-        print("- Live command log scrolling")
-        print("- Server statistics updating")
-        print("- Instant response to web controls")
-        
-        print("\nPress Ctrl+C to stop all services")
+        print(INSTRUCTIONS)
         
         # Keep running until interrupted
         await manual_control_task
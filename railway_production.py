@@ -9,26 +9,54 @@ compatibility with the complete local development system.
 import asyncio
 import logging
 import os
+import queue
+import re
 import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+import orjson
+
+from cloud.data_aggregator.data_processor import DataProcessor
+from cloud.orchestrator.cloud_orchestrator import CloudOrchestrator
+
+
+def configure_logging():
+    """Route log records through a queue so the event loop never blocks on stderr."""
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    # Background thread performs the actual stderr writes
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
 # Configure logging for production
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+log_listener = configure_logging()
 logger = logging.getLogger(__name__)
 
+# KEY=value assignments; blank lines and comments never match
+ENV_LINE_PATTERN = re.compile(r"^\s*([A-Za-z_]\w*)\s*=\s*(.*?)\s*$")
+
+
 def load_env_file():
     """Load environment variables from .env file if it exists."""
     env_file = Path(__file__).parent / ".env"
     if env_file.exists():
         with open(env_file, 'r') as f:
+            parsed = {}
             for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+                match = ENV_LINE_PATTERN.match(line)
+                if match:
+                    parsed[match[1]] = match[2]
+        os.environ.update(parsed)
                     
 load_env_file()
 
@@ -57,10 +85,12 @@ def get_system_mode():
 def save_last_motor_states(motor_states):
     """Save last motor states for smooth transitions."""
     try:
-        import json
         states_file = Path(__file__).parent / "last_motor_states.json"
-        with open(states_file, 'w') as f:
-            json.dump(motor_states, f, indent=2)
+        # Write to a sibling temp file and swap it in so readers never see a partial file
+        tmp_file = states_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(motor_states, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, states_file)
         logger.info(f"Saved motor states for transition: {len(motor_states)} motors")
     except Exception as e:
         logger.error(f"Error saving motor states: {e}")
@@ -69,8 +99,6 @@ async def start_cloud_orchestrator():
     """Start the cloud orchestrator for production."""
     logger.info("Starting Cloud Orchestrator for Railway deployment...")
     
-    from cloud.orchestrator.cloud_orchestrator import CloudOrchestrator
-    
     global cloud_orchestrator_instance
     
     # Get port from Railway environment or default
@@ -80,33 +108,44 @@ async def start_cloud_orchestrator():
     cloud_orchestrator_instance = CloudOrchestrator(host=host, port=port)
     orchestrator_task = asyncio.create_task(cloud_orchestrator_instance.start_server())
     
+    # Wait until the port is bound, surfacing startup failures immediately
+    ready_task = asyncio.create_task(cloud_orchestrator_instance.ready.wait())
+    await asyncio.wait(
+        {orchestrator_task, ready_task}, return_when=asyncio.FIRST_COMPLETED
+    )
+    if orchestrator_task.done():
+        ready_task.cancel()
+        orchestrator_task.result()
+
     logger.info(f"Cloud Orchestrator started on {host}:{port}")
     return orchestrator_task
 
-async def start_blockchain_service():
-    """Start blockchain data processing for production."""
+async def start_blockchain_service(orchestrator: CloudOrchestrator):
+    """Start blockchain data processing for production, broadcasting via orchestrator."""
     logger.info("Starting Blockchain Data Service...")
     
-    from cloud.data_aggregator.data_processor import DataProcessor
-    import socket
-    import json
-    
     processor = DataProcessor()
     
     async def blockchain_loop():
         current_block = None
         
         while True:
+            mode = get_system_mode()
+            if mode != "auto":
+                logger.debug("System in manual mode, pausing blockchain processing")
+                await asyncio.sleep(5)
+                continue
+
+            # Process blockchain data
             try:
-                mode = get_system_mode()
-                if mode != "auto":
-                    logger.debug("System in manual mode, pausing blockchain processing")
-                    await asyncio.sleep(5)
-                    continue
-                
-                # Process blockchain data
                 result = await processor.process_latest_block()
-                
+            except Exception as e:
+                logger.error(f"Blockchain processing error: {e}")
+                await asyncio.sleep(30)  # Wait longer on errors
+                continue
+
+            # Build and broadcast the update; a failure here must not end the loop
+            try:
                 if result and hasattr(result, 'to_execution_format'):
                     block_number = getattr(result, 'block_number', 'N/A')
                     
@@ -130,53 +169,54 @@ async def start_blockchain_service():
                         logger.info(f"BLOCK {block_number}: ETH=${blockchain_data['eth_price_usd']:.2f}, "
                                    f"Gas={blockchain_data['gas_price_gwei']:.1f} gwei")
                         
-                        # Save motor states for transitions
+                        # Build transition and frontend motor formats in a single pass
                         motor_states = {}
+                        frontend_commands = {}
                         for motor_name, motor_data in motor_commands.items():
+                            velocity_rpm = motor_data["velocity_rpm"]
+                            direction = motor_data["direction"]
                             motor_states[motor_name] = {
-                                "rpm": motor_data["velocity_rpm"],
-                                "dir": motor_data["direction"]
+                                "rpm": velocity_rpm,
+                                "dir": direction,
                             }
+                            frontend_commands[motor_name] = {
+                                "velocity_rpm": velocity_rpm,
+                                "direction": direction,
+                            }
+
+                        # Save motor states for transitions
                         save_last_motor_states(motor_states)
                         
                         # Broadcast to connected web clients
-                        if cloud_orchestrator_instance:
-                            try:
-                                # Convert for frontend
-                                frontend_commands = {}
-                                for motor_name, motor_data in motor_commands.items():
-                                    frontend_commands[motor_name] = {
+                        try:
+                            # Broadcast blockchain data
+                            await orchestrator.broadcast_blockchain_data(
+                                blockchain_data, frontend_commands
+                            )
+
+                            # Update individual motor states
+                            for motor_name, motor_data in frontend_commands.items():
+                                await orchestrator.broadcast_motor_state_update(
+                                    motor_name,
+                                    {
                                         "velocity_rpm": motor_data["velocity_rpm"],
-                                        "direction": motor_data["direction"]
-                                    }
-                                
-                                # Broadcast blockchain data
-                                await cloud_orchestrator_instance.broadcast_blockchain_data(
-                                    blockchain_data, frontend_commands
+                                        "direction": motor_data["direction"],
+                                        "last_update": time.time(),
+                                        "is_enabled": True,
+                                        "source": "blockchain",
+                                    },
                                 )
-                                
-                                # Update individual motor states
-                                for motor_name, motor_data in frontend_commands.items():
-                                    await cloud_orchestrator_instance.broadcast_motor_state_update(
-                                        motor_name, {
-                                            "velocity_rpm": motor_data["velocity_rpm"],
-                                            "direction": motor_data["direction"],
-                                            "last_update": time.time(),
-                                            "is_enabled": True,
-                                            "source": "blockchain"
-                                        }
-                                    )
-                                
-                                logger.info("Broadcasted blockchain data to web clients")
-                                
-                            except Exception as e:
-                                logger.error(f"Failed to broadcast data: {e}")
-                
-                await asyncio.sleep(10)  # Check every 10 seconds
-                
+
+                            logger.info("Broadcasted blockchain data to web clients")
+
+                        except Exception as e:
+                            logger.error(f"Failed to broadcast data: {e}")
             except Exception as e:
-                logger.error(f"Blockchain processing error: {e}")
+                logger.error(f"Blockchain update error: {e}")
                 await asyncio.sleep(30)  # Wait longer on errors
+                continue
+
+            await asyncio.sleep(10)  # Check every 10 seconds
     
     return asyncio.create_task(blockchain_loop())
 
@@ -189,9 +229,8 @@ async def main():
     try:
         # Start services
         orchestrator_task = await start_cloud_orchestrator()
-        await asyncio.sleep(2)  # Let orchestrator start
         
-        blockchain_task = await start_blockchain_service()
+        blockchain_task = await start_blockchain_service(cloud_orchestrator_instance)
         
         logger.info("✅ All production services started successfully!")
         logger.info(f"🌐 Server listening on port {os.environ.get('PORT', 8768)}")
@@ -212,4 +251,7 @@ async def main():
 
 if __name__ == "__main__":
     # Production server entry point
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    finally:
+        log_listener.stop()
@@ -12,57 +12,220 @@ Project: Drawing Machine
 Technology: Python 3.11+ with Poetry, pytest, watchdog
 """
 
+import asyncio
+import contextlib
+import ctypes
+import functools
+import heapq
+import io
+import itertools
 import json
+import logging
+import multiprocessing
 import os
-import subprocess
+import queue
+import re
+import selectors
+import struct
 import sys
+import tempfile
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from importlib.util import find_spec
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 try:
     from watchdog.events import (
         FileCreatedEvent,
         FileDeletedEvent,
         FileModifiedEvent,
+        FileMovedEvent,
         FileSystemEventHandler,
     )
-    from watchdog.observers import Observer
 except ImportError:
     print("Installing required dependencies...")
     os.system("pip install watchdog")
     from watchdog.events import (
+        FileCreatedEvent,
+        FileDeletedEvent,
+        FileModifiedEvent,
+        FileMovedEvent,
         FileSystemEventHandler,
     )
-    from watchdog.observers import Observer
+
+# watchdog's observers are only needed once watching starts, not for --run-test
+if TYPE_CHECKING:
+    from watchdog.observers.api import BaseObserver
 
 try:
     from colorama import Back, Fore, Style, init
 
     init(autoreset=True)
 except ImportError:
-    print("Installing colorama for colored output...")
-    os.system("pip install colorama")
-    from colorama import Back, Fore, Style, init
+    # Plain output: every colour code this module uses is an empty string
+    Fore = Back = Style = SimpleNamespace(
+        **dict.fromkeys(
+            (
+                "BLUE",
+                "CYAN",
+                "GREEN",
+                "MAGENTA",
+                "RED",
+                "WHITE",
+                "YELLOW",
+                "DIM",
+                "RESET_ALL",
+            ),
+            "",
+        )
+    )
 
-    init(autoreset=True)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Only subscribe to content changes; open/close/access events never reach Python
+WATCHED_EVENT_TYPES = [
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+]
+
+
+logger = logging.getLogger(__name__)
+
+
+def configure_logging(level: int = logging.INFO) -> QueueListener:
+    """Route log records through a queue so event handling never blocks on output."""
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    # Background thread performs the actual terminal writes
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+# Seconds a single pytest run may take before it is abandoned
+TEST_TIMEOUT = 300
+
+# Lines of pytest output retained per run; older lines are only shown live
+OUTPUT_TAIL_LINES = 4096
+
+# Most recent pytest JSON reports kept for inspection; older ones are deleted
+KEPT_REPORTS = 5
+
+
+def load_json_file(path: Path) -> dict:
+    """Parse a JSON report, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def default_reports_dir() -> Path:
+    """Report location: DM_REPORTS_DIR, else tmpfs on Linux, else the temp dir."""
+    if "DM_REPORTS_DIR" in os.environ:
+        return Path(os.environ["DM_REPORTS_DIR"])
+    # /dev/shm and /tmp are shared by all users; keep each user's reports apart
+    name = f"dm_reports_{os.getuid()}" if hasattr(os, "getuid") else "dm_reports"
+    if Path("/dev/shm").is_dir():
+        return Path("/dev/shm") / name
+    return Path(tempfile.gettempdir()) / name
+
+
+def _pytest_context():
+    """
+    Multiprocessing context whose server process has pytest imported.
+
+    Each run forks from that server, so pytest and its plugins are imported
+    once per session while project modules are still imported fresh and pick
+    up the edits being tested. Returns None where forkserver is unavailable.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(["pytest"])
+    return context
+
+
+class _ConnectionWriter(io.TextIOBase):
+    """Text stream sending complete lines as ("output", text) messages."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.buffer = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.buffer += text
+        if "\n" in self.buffer:
+            lines, _, self.buffer = self.buffer.rpartition("\n")
+            self.conn.send(("output", lines + "\n"))
+        return len(text)
+
+    def flush(self) -> None:
+        # pytest flushes partial lines ("test_x " before "PASSED"); they are
+        # held back until complete so each line is logged as one record
+        pass
+
+    def close(self) -> None:
+        """Send an unterminated last line, if any."""
+        if self.buffer:
+            self.conn.send(("output", self.buffer))
+            self.buffer = ""
+        super().close()
+
+
+def _run_pytest_in_child(
+    args: list[str], project_root: str, env: dict[str, str], conn
+) -> None:
+    """Run pytest.main in a forked child, streaming output then ("exit", code)."""
+    import pytest
+
+    os.environ.update(env)
+    os.chdir(project_root)
+    sys.path.insert(0, project_root)
+
+    output = _ConnectionWriter(conn)
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            exit_code = pytest.main(args)
+    finally:
+        output.close()
+
+    conn.send(("exit", int(exit_code)))
+    conn.close()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileChangeEvent:
     """Represents a file change event with metadata."""
 
     file_path: Path
     event_type: str
-    timestamp: datetime
+    timestamp: int  # time.monotonic_ns(); see FileWatcher.event_time()
     project_area: str
     is_test_file: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestResult:
     """Represents test execution results with detailed metadata."""
 
@@ -81,6 +244,352 @@ class TestResult:
     execution_error: str | None = None
 
 
+class CoalescedDebouncer:
+    """
+    Debounce keyed changes on a single background thread.
+
+    Each key keeps only its most recent value and deadline, or the result of
+    ``merge`` applied to its pending and new values. One worker thread
+    sleeps until the earliest deadline and hands every settled value to the
+    callback in a single batch, so bursts of changes never spawn a thread or
+    timer per event. Deadlines sit in a min-heap; entries superseded by a
+    later change are skipped when they reach the top.
+
+    A key that has not fired within the last ``delay`` seconds is released
+    after only ``settle`` seconds, which is enough to absorb the handful of
+    events a single save produces. Keys changing again soon after firing wait
+    the full ``delay``.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[list], None],
+        delay: float,
+        max_pending: int = 512,
+        settle: float = 0.1,
+        merge: Callable[[object, object], object | None] | None = None,
+    ):
+        """
+        Initialize the debouncer.
+
+        Args:
+            callback: Function receiving the list of settled values
+            delay: Seconds a key must stay quiet before its value is released
+            max_pending: Most keys held at once; the least recently changed
+                key is dropped beyond this
+            settle: Quiet period for the first change to an idle key
+            merge: Function combining a key's pending value with a new one;
+                returning None drops the key. The new value wins if None
+        """
+        self.callback = callback
+        self.delay = delay
+        self.max_pending = max_pending
+        self.settle = min(settle, delay)
+        self.merge = merge
+        self.pending: dict[str, tuple[float, object]] = {}
+        self._deadlines: list[tuple[float, str]] = []
+        self._last_fired: dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of keys waiting for their debounce window to close."""
+        return len(self.pending)
+
+    def submit(self, key: str, value) -> None:
+        """
+        Record a change, restarting the debounce window for its key.
+
+        Args:
+            key: Identity used to coalesce repeated changes
+            value: Latest value to deliver once the key settles
+        """
+        with self._condition:
+            previous = self.pending.pop(key, None)
+            if previous is not None and self.merge is not None:
+                value = self.merge(previous[1], value)
+                if value is None:
+                    # The changes cancelled out; its heap entry is now stale
+                    return
+
+            # Re-insert so dict order runs from least to most recently changed
+            now = time.monotonic()
+            last_fired = self._last_fired.get(key)
+            if last_fired is None or now - last_fired >= self.delay:
+                deadline = now + self.settle
+            else:
+                deadline = now + self.delay
+            self.pending[key] = (deadline, value)
+            heapq.heappush(self._deadlines, (deadline, key))
+            if len(self.pending) > self.max_pending:
+                dropped = next(iter(self.pending))
+                del self.pending[dropped]
+                logger.warning(
+                    f"{Fore.YELLOW}More than {self.max_pending} pending changes - "
+                    f"dropping {dropped}"
+                )
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="debounce-worker", daemon=True
+                )
+                self._worker.start()
+            self._condition.notify()
+
+    def stop(self) -> int:
+        """
+        Stop the worker and drop anything still pending.
+
+        Returns:
+            Number of pending changes that were cancelled
+        """
+        with self._condition:
+            cancelled = len(self.pending)
+            self.pending.clear()
+            self._deadlines.clear()
+            self._worker = None
+            self._condition.notify()
+        return cancelled
+
+    def _next_batch(self, worker: threading.Thread) -> list | None:
+        """Block until values settle; None once this worker is retired."""
+        with self._condition:
+            while self._worker is worker:
+                self._discard_stale()
+                if not self._deadlines:
+                    self._condition.wait()
+                    continue
+
+                now = time.monotonic()
+                if self._deadlines[0][0] > now:
+                    self._condition.wait(self._deadlines[0][0] - now)
+                    continue
+
+                ready = []
+                while self._deadlines and self._deadlines[0][0] <= now:
+                    _, key = heapq.heappop(self._deadlines)
+                    ready.append(self.pending.pop(key)[1])
+                    self._last_fired[key] = now
+                    self._discard_stale()
+                return ready
+        return None
+
+    def _discard_stale(self) -> None:
+        """Pop heap entries whose key was changed again, settled or dropped."""
+        while self._deadlines:
+            deadline, key = self._deadlines[0]
+            entry = self.pending.get(key)
+            if entry is not None and entry[0] == deadline:
+                return
+            heapq.heappop(self._deadlines)
+
+    def _run(self) -> None:
+        """Worker loop delivering settled batches outside the lock."""
+        worker = threading.current_thread()
+        while (batch := self._next_batch(worker)) is not None:
+            try:
+                self.callback(batch)
+            except Exception:
+                logger.exception(f"{Fore.RED}Error handling file changes")
+
+
+class _InotifyObserver(threading.Thread):
+    """
+    Watch every monitored tree from one inotify descriptor on one thread.
+
+    watchdog's observers start an emitter thread, each with its own inotify
+    descriptor, for every scheduled path. Here all watches share a single
+    descriptor. One thread waits for it in a selector and dispatches events
+    to the handler directly. The thread is woken through a pipe when stopped.
+    It has the same start/stop/join interface as a watchdog observer, so the
+    polling fallback still applies.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = (
+        IN_MODIFY | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_MOVE_SELF
+    )
+
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self):
+        super().__init__(name="inotify-observer", daemon=True)
+        libc = ctypes.CDLL(None, use_errno=True)
+        # AttributeError here means this libc has no inotify support
+        self._inotify_init1 = libc.inotify_init1
+        self._inotify_add_watch = libc.inotify_add_watch
+        self._inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        self._inotify_rm_watch = libc.inotify_rm_watch
+        self._fd: int | None = None
+        self._wake_r = self._wake_w = -1
+        self._handler: FileSystemEventHandler | None = None
+        self._event_filter: tuple[type, ...] | None = None
+        self._recursive = True
+        self._watches: dict[int, str] = {}
+
+    def schedule(
+        self,
+        event_handler: FileSystemEventHandler,
+        path: str,
+        recursive: bool = False,
+        event_filter: list[type] | None = None,
+    ) -> None:
+        """
+        Add watches for a directory tree.
+
+        Args:
+            event_handler: Handler receiving events; shared by all paths
+            path: Directory to watch
+            recursive: Also watch every subdirectory, including new ones
+            event_filter: Event classes to deliver (all if None)
+
+        Raises:
+            OSError: If inotify is unavailable or the watch limit is reached
+        """
+        if self._fd is None:
+            fd = self._inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            self._fd = fd
+        self._handler = event_handler
+        self._event_filter = tuple(event_filter) if event_filter else None
+        self._recursive = recursive
+        self._add_tree(path, report_files=False)
+
+    def unschedule_all(self) -> None:
+        """Close the descriptor, dropping every watch."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._watches.clear()
+
+    def start(self) -> None:
+        """Open the wake-up pipe and start the selector thread."""
+        self._wake_r, self._wake_w = os.pipe()
+        super().start()
+
+    def stop(self) -> None:
+        """Wake the selector so the thread exits."""
+        os.write(self._wake_w, b"\0")
+
+    def run(self) -> None:
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._fd, selectors.EVENT_READ)
+            selector.register(self._wake_r, selectors.EVENT_READ)
+            try:
+                while True:
+                    ready = selector.select()
+                    if any(key.fd == self._wake_r for key, _ in ready):
+                        return
+                    self._read_events()
+            finally:
+                self.unschedule_all()
+                os.close(self._wake_r)
+                os.close(self._wake_w)
+
+    def _add_watch(self, directory: str) -> None:
+        wd = self._inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), directory)
+        self._watches[wd] = directory
+
+    def _drop_tree(self, root: str) -> None:
+        """Remove the watches on a directory that left its path, and below it."""
+        prefix = root + os.sep
+        for wd, directory in list(self._watches.items()):
+            if directory == root or directory.startswith(prefix):
+                del self._watches[wd]
+                # The kernel follows the moved inode; stop its events
+                self._inotify_rm_watch(self._fd, wd)
+
+    def _add_tree(self, root: str, report_files: bool) -> None:
+        """Watch a directory and, if recursive, everything below it."""
+        self._add_watch(root)
+        if not self._recursive:
+            return
+        for dirpath, dirnames, filenames in os.walk(root):
+            for name in dirnames:
+                self._add_watch(os.path.join(dirpath, name))
+            if report_files:
+                # Files written before the new directory's watch existed
+                for name in filenames:
+                    self._dispatch(FileCreatedEvent(os.path.join(dirpath, name)))
+
+    def _read_events(self) -> None:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                logger.warning("inotify queue overflowed; some changes were missed")
+                continue
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & self.IN_MOVE_SELF:
+                # A scheduled root was moved away (subdirectories are handled
+                # through IN_MOVED_FROM in their parent)
+                self._drop_tree(directory)
+                continue
+
+            path = os.path.join(directory, name)
+            if mask & self.IN_ISDIR:
+                if mask & self.IN_MOVED_FROM:
+                    self._drop_tree(path)
+                elif self._recursive and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    try:
+                        self._add_tree(path, report_files=True)
+                    except OSError as e:
+                        logger.warning(f"Cannot watch new directory {path}: {e}")
+            elif mask & self.IN_MODIFY:
+                self._dispatch(FileModifiedEvent(path))
+            # Moves are not paired by cookie; like watchdog's emitter for moves
+            # across the tree boundary, report each side as created or deleted
+            elif mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self._dispatch(FileCreatedEvent(path))
+            elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                self._dispatch(FileDeletedEvent(path))
+
+    def _dispatch(self, event) -> None:
+        if self._event_filter is None or isinstance(event, self._event_filter):
+            try:
+                self._handler.dispatch(event)
+            except Exception:
+                logger.exception(f"{Fore.RED}Error handling file event")
+
+
+def _compile_ignore_patterns(patterns: frozenset[str]) -> re.Pattern:
+    """Build one alternation matching any pattern as a whole path component."""
+    names = "|".join(
+        re.escape(pattern).replace(r"\*", r"[^/\\]*") for pattern in sorted(patterns)
+    )
+    return re.compile(rf"(?:^|[/\\])(?:{names})(?:[/\\]|$)")
+
+
 class DrawingMachineFileHandler(FileSystemEventHandler):
     """
     Custom file system event handler for Drawing Machine project structure.
@@ -89,21 +598,54 @@ class DrawingMachineFileHandler(FileSystemEventHandler):
     event processing to prevent excessive triggering on rapid file changes.
     """
 
+    IGNORE_PATTERNS = frozenset(
+        {
+            "__pycache__",
+            ".pytest_cache",
+            ".mypy_cache",
+            ".ruff_cache",
+            ".pyc",
+            ".pyo",
+            ".pyd",
+            ".git",
+            "node_modules",
+            ".vscode",
+            ".idea",
+            "venv",
+            ".venv",
+            "env",
+            ".tox",
+            "build",
+            "dist",
+            "*.egg-info",
+        }
+    )
+    _IGNORE_RE = _compile_ignore_patterns(IGNORE_PATTERNS)
+
     def __init__(
-        self, callback: Callable[[FileChangeEvent], None], debounce_delay: float = 2.0
+        self,
+        callback: Callable[[list[FileChangeEvent]], None],
+        debounce_delay: float = 2.0,
+        project_root: Path | None = None,
     ):
         """
         Initialize the file handler.
 
         Args:
-            callback: Function to call when a debounced file change occurs
+            callback: Function called with the file changes settled in one
+                debounce window
             debounce_delay: Seconds to wait after last change before triggering callback
+            project_root: Root whose test output directories are never reported
         """
         super().__init__()
         self.callback = callback
         self.debounce_delay = debounce_delay
-        self.pending_changes: dict[str, threading.Timer] = {}
-        self.lock = threading.Lock()
+        self.debouncer = CoalescedDebouncer(
+            self._dispatch_settled, debounce_delay, merge=self._merge_changes
+        )
+
+        # Raw file events seen, ignored ones included; see dispatch()
+        self.events_detected = 0
 
         # Define monitored directories and their purposes
         self.project_areas = {
@@ -113,25 +655,18 @@ class DrawingMachineFileHandler(FileSystemEventHandler):
             "tests": "Test Suites (unit, integration, e2e)",
             "scripts": "Development Scripts (TDD workflow, automation)",
         }
+        self._area_names = frozenset(self.project_areas)
 
         # Files and directories to ignore
-        self.ignore_patterns = {
-            "__pycache__",
-            ".pytest_cache",
-            ".pyc",
-            ".pyo",
-            ".pyd",
-            ".git",
-            "node_modules",
-            ".vscode",
-            ".idea",
-            "venv",
-            "env",
-            ".tox",
-            "build",
-            "dist",
-            "*.egg-info",
-        }
+        self.ignore_patterns = self.IGNORE_PATTERNS
+
+        # Test runs write here; reporting those writes would re-trigger the runs.
+        # Plain strings with a trailing separator, matched by str.startswith
+        project_root = os.path.abspath(project_root or Path.cwd())
+        self.generated_dirs = tuple(
+            os.path.join(project_root, name) + os.sep
+            for name in ("reports", ".coverage", "htmlcov", ".pytest_cache")
+        )
 
     def should_ignore_file(self, file_path: Path) -> bool:
         """
@@ -147,18 +682,14 @@ class DrawingMachineFileHandler(FileSystemEventHandler):
         if not file_path.suffix == ".py":
             return True
 
-        # Check ignore patterns in path
-        path_str = str(file_path)
-        for pattern in self.ignore_patterns:
-            if pattern in path_str:
-                return True
+        # Check ignore patterns against every path component in one scan
+        path = os.fspath(file_path)
+        if self._IGNORE_RE.search(path):
+            return True
 
-        # Check if path contains any ignored directory
-        for part in file_path.parts:
-            if part in self.ignore_patterns:
-                return True
-
-        return False
+        # Never react to output written by our own test runs; abspath is
+        # string work only, where resolve() would stat every component
+        return os.path.abspath(path).startswith(self.generated_dirs)
 
     def get_project_area(self, file_path: Path) -> str:
         """
@@ -168,12 +699,15 @@ class DrawingMachineFileHandler(FileSystemEventHandler):
             file_path: Path to the file
 
         Returns:
-            Project area name or 'other' if not in a recognized area
+            Project area name or 'other' if not in a recognized area. The name
+            is the interned key from project_areas, never a copy taken from
+            the path, so every event for an area shares one string object.
         """
-        for area in self.project_areas.keys():
-            if area in file_path.parts:
-                return area
-        return "other"
+        # One set intersection; the loop only runs over the (rare) matches
+        matches = self._area_names.intersection(file_path.parts)
+        if not matches:
+            return "other"
+        return next(area for area in self.project_areas if area in matches)
 
     def is_test_file(self, file_path: Path) -> bool:
         """
@@ -192,13 +726,17 @@ class DrawingMachineFileHandler(FileSystemEventHandler):
             or "test" in file_path.parts
         )
 
-    def create_file_event(self, file_path: Path, event_type: str) -> FileChangeEvent:
+    def create_file_event(
+        self, file_path: Path, event_type: str, timestamp: int | None = None
+    ) -> FileChangeEvent:
         """
         Create a FileChangeEvent from file path and event type.
 
         Args:
             file_path: Path to the changed file
             event_type: Type of file system event
+            timestamp: time.monotonic_ns() when the change settled
+                (defaults to now)
 
         Returns:
             FileChangeEvent instance with metadata
@@ -206,7 +744,7 @@ class DrawingMachineFileHandler(FileSystemEventHandler):
         return FileChangeEvent(
             file_path=file_path,
             event_type=event_type,
-            timestamp=datetime.now(),
+            timestamp=timestamp or time.monotonic_ns(),
             project_area=self.get_project_area(file_path),
             is_test_file=self.is_test_file(file_path),
         )
@@ -219,26 +757,53 @@ class DrawingMachineFileHandler(FileSystemEventHandler):
             file_path: Path to the changed file
             event_type: Type of file system event
         """
-        file_key = str(file_path)
+        # The same few paths recur constantly while editing
+        self.debouncer.submit(sys.intern(str(file_path)), (file_path, event_type))
 
-        with self.lock:
-            # Cancel existing timer for this file
-            if file_key in self.pending_changes:
-                self.pending_changes[file_key].cancel()
+    @staticmethod
+    def _merge_changes(
+        earlier: tuple[Path, str], later: tuple[Path, str]
+    ) -> tuple[Path, str] | None:
+        """
+        Combine two unsettled changes to the same file into their net effect.
+
+        Args:
+            earlier: Pending (file_path, event_type)
+            later: New (file_path, event_type)
 
-            # Create new timer
-            def trigger_callback():
-                with self.lock:
-                    if file_key in self.pending_changes:
-                        del self.pending_changes[file_key]
+        Returns:
+            The change to report, or None if the file is back where it started
+        """
+        if earlier[1] == "created":
+            # Editors often write right after creating; keep it a creation
+            return None if later[1] == "deleted" else earlier
+        if earlier[1] == "deleted" and later[1] == "created":
+            return (later[0], "modified")
+        return later
+
+    def _dispatch_settled(self, changes: list[tuple[Path, str]]) -> None:
+        """
+        Create and send events for changes whose debounce window closed.
 
-                # Create and send event
-                event = self.create_file_event(file_path, event_type)
-                self.callback(event)
+        Args:
+            changes: (file_path, event_type) pairs released by the debouncer
+        """
+        # The whole batch settled together, so it shares one timestamp
+        now = time.monotonic_ns()
+        self.callback(
+            [
+                self.create_file_event(file_path, event_type, now)
+                for file_path, event_type in changes
+            ]
+        )
 
-            timer = threading.Timer(self.debounce_delay, trigger_callback)
-            self.pending_changes[file_key] = timer
-            timer.start()
+    def dispatch(self, event):
+        """Count every file event before routing it to the on_* handlers."""
+        # The observer delivers all events from its single dispatcher thread,
+        # so this plain counter needs no lock
+        if not event.is_directory:
+            self.events_detected += 1
+        super().dispatch(event)
 
     def on_modified(self, event):
         """Handle file modification events."""
@@ -261,6 +826,19 @@ class DrawingMachineFileHandler(FileSystemEventHandler):
             if not self.should_ignore_file(file_path):
                 self.debounce_change(file_path, "deleted")
 
+    def on_moved(self, event):
+        """Handle file move events (editors that save via rename)."""
+        # The file vanishes at one path and appears at the other; as separate
+        # changes, a renamed test file invalidates the cached test lists
+        if not event.is_directory:
+            for path, event_type in (
+                (event.src_path, "deleted"),
+                (event.dest_path, "created"),
+            ):
+                file_path = Path(path)
+                if not self.should_ignore_file(file_path):
+                    self.debounce_change(file_path, event_type)
+
 
 class TestExecutor:
     """
@@ -270,16 +848,23 @@ class TestExecutor:
     select and execute appropriate tests when files change.
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, incremental: bool = True):
         """
         Initialize the TestExecutor.
 
         Args:
             project_root: Root directory of the Drawing Machine project
+            incremental: Let pytest-testmon skip tests unaffected by the
+                latest changes, when the plugin is installed
         """
         self.project_root = project_root
-        self.reports_dir = project_root / "reports" / "pytest"
+        self.use_testmon = incremental and find_spec("testmon") is not None
+        # Reports are short-lived, so keep them off the project disk
+        self.reports_dir = default_reports_dir() / "pytest"
         self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self._rotate_lock = threading.Lock()
+        self._mp_context = _pytest_context()
+        self._run_ids = itertools.count()
 
         # Test file mapping for smart test selection
         self.test_mappings = {
@@ -298,6 +883,37 @@ class TestExecutor:
             ],
         }
 
+        # Default: run foundational model tests (our most stable test suite)
+        self.default_test = "tests/unit/test_foundational_models.py"
+
+        # Test files rarely appear or vanish mid-session; see invalidate_test_cache
+        self._existing_tests_for_area = functools.lru_cache(maxsize=None)(
+            self._find_existing_tests
+        )
+        self._tests_for_path = functools.lru_cache(maxsize=512)(self._select_tests)
+
+    def _find_existing_tests(self, area: str | None) -> tuple[str, ...]:
+        """
+        Filter the tests mapped to an area down to files that exist.
+
+        Args:
+            area: Project area from test_mappings, or None for the default test
+
+        Returns:
+            Existing test file paths relative to the project root
+        """
+        candidates = self.test_mappings[area] if area else [self.default_test]
+        return tuple(
+            test_path
+            for test_path in candidates
+            if (self.project_root / test_path).exists()
+        )
+
+    def invalidate_test_cache(self) -> None:
+        """Forget which mapped test files exist, after tests are added or removed."""
+        self._existing_tests_for_area.cache_clear()
+        self._tests_for_path.cache_clear()
+
     def determine_tests_for_file(self, file_path: Path) -> list[str]:
         """
         Determine which tests should run for a changed file.
@@ -308,93 +924,115 @@ class TestExecutor:
         Returns:
             List of test file paths to execute
         """
-        file_str = str(file_path).lower()
+        # The same few files are saved over and over while editing
+        return list(self._tests_for_path(os.fspath(file_path)))
+
+    def _select_tests(self, path: str) -> tuple[str, ...]:
+        """Uncached test selection behind determine_tests_for_file."""
+        file_path = Path(path)
 
         # If it's already a test file, run just that test
         if file_path.name.startswith("test_") or "test" in file_path.parts:
-            return [str(file_path)]
+            return (path,)
 
         # Determine project area and get corresponding tests
         for area in self.test_mappings:
             if area in file_path.parts:
-                # Filter to existing test files
-                existing_tests = []
-                for test_path in self.test_mappings[area]:
-                    full_path = self.project_root / test_path
-                    if full_path.exists():
-                        existing_tests.append(test_path)
-                return existing_tests
+                return self._existing_tests_for_area(area)
 
-        # Default: run foundational model tests (our most stable test suite)
-        default_test = "tests/unit/test_foundational_models.py"
-        if (self.project_root / default_test).exists():
-            return [default_test]
-
-        return []
+        return self._existing_tests_for_area(None)
 
     def run_tests(
-        self, test_path: str | None = None, with_coverage: bool = True
+        self,
+        test_path: str | list[str] | None = None,
+        with_coverage: bool = True,
+        triggered_by: str | None = None,
+    ) -> TestResult:
+        """
+        Execute pytest with the specified parameters, blocking until done.
+
+        Args:
+            test_path: Test file/path, or several run in one pytest session
+                (None for all tests)
+            with_coverage: Whether to include coverage analysis
+            triggered_by: What caused this run (defaults to the test path)
+
+        Returns:
+            TestResult with execution details
+        """
+        return asyncio.run(self.run_tests_async(test_path, with_coverage, triggered_by))
+
+    async def run_tests_async(
+        self,
+        test_path: str | list[str] | None = None,
+        with_coverage: bool = True,
+        triggered_by: str | None = None,
     ) -> TestResult:
         """
         Execute pytest with the specified parameters.
 
         Args:
-            test_path: Specific test file/path to run (None for all tests)
+            test_path: Test file/path, or several run in one pytest session
+                (None for all tests)
             with_coverage: Whether to include coverage analysis
+            triggered_by: What caused this run (defaults to the test path)
 
         Returns:
             TestResult with execution details
         """
         timestamp = datetime.now()
+        test_paths = [test_path] if isinstance(test_path, str) else test_path or []
+        test_label = " ".join(test_paths) or "all"
+        triggered_by = triggered_by or (test_label if test_paths else "manual")
 
         # Prepare pytest command
         cmd = ["python", "-m", "pytest"]
+        cmd.extend(test_paths)
 
-        if test_path:
-            cmd.append(test_path)
+        # Unique per run so concurrent runs never share report or coverage files
+        run_id = f"{os.getpid()}_{next(self._run_ids)}"
+        coverage_file = self.reports_dir / f".coverage_{run_id}"
+        coverage_report = self.reports_dir / f"coverage_{run_id}.json"
+        env = {}
 
         # Add coverage if requested
         if with_coverage:
             cmd.extend(["--cov=shared", "--cov=edge", "--cov=cloud", "--cov=scripts"])
-            cmd.extend(["--cov-report=json", "--cov-report=term"])
+            cmd.extend([f"--cov-report=json:{coverage_report}", "--cov-report=term"])
+            env["COVERAGE_FILE"] = str(coverage_file)
 
         # Add JSON report for parsing
-        report_file = (
-            self.reports_dir
-            / f"pytest_report_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-        )
+        report_file = self.reports_dir / f"pytest_report_{run_id}.json"
         cmd.extend(["--json-report", f"--json-report-file={report_file}"])
 
+        # Only run tests whose code changed since testmon last saw them
+        if self.use_testmon:
+            cmd.append("--testmon")
+
         # Add other useful options
         cmd.extend(["-v", "--tb=short"])
 
-        print(
+        logger.info(
             f"{Fore.BLUE}Running tests: {' '.join(cmd[3:])}"
         )  # Skip 'python -m pytest'
-        print(f"{Fore.YELLOW}Please wait...")
 
         try:
             # Execute pytest with timeout
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5-minute timeout
-            )
+            returncode, stdout, stderr = await self.execute_pytest(cmd, env)
 
             # Parse results
             return self.parse_test_results(
                 report_file=report_file,
-                test_path=test_path or "all",
-                triggered_by=str(test_path or "manual"),
+                coverage_report=coverage_report if with_coverage else None,
+                test_path=test_label,
+                triggered_by=triggered_by,
                 timestamp=timestamp,
-                stdout=result.stdout,
-                stderr=result.stderr,
-                returncode=result.returncode,
+                stdout=stdout,
+                stderr=stderr,
+                returncode=returncode,
             )
 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return TestResult(
                 success=False,
                 total_tests=0,
@@ -402,10 +1040,10 @@ class TestExecutor:
                 failed=0,
                 skipped=0,
                 errors=1,
-                duration_seconds=300.0,
+                duration_seconds=float(TEST_TIMEOUT),
                 coverage_percent=None,
-                test_file=test_path or "all",
-                triggered_by=str(test_path or "manual"),
+                test_file=test_label,
+                triggered_by=triggered_by,
                 timestamp=timestamp,
                 failure_details=["Test execution timed out after 5 minutes"],
                 execution_error="TIMEOUT",
@@ -421,13 +1059,156 @@ class TestExecutor:
                 errors=1,
                 duration_seconds=0.0,
                 coverage_percent=None,
-                test_file=test_path or "all",
-                triggered_by=str(test_path or "manual"),
+                test_file=test_label,
+                triggered_by=triggered_by,
                 timestamp=timestamp,
                 failure_details=[f"Execution error: {str(e)}"],
                 execution_error=str(e),
             )
 
+        finally:
+            coverage_file.unlink(missing_ok=True)
+            coverage_report.unlink(missing_ok=True)
+            self._rotate_reports()
+
+    def _rotate_reports(self) -> None:
+        """Delete reports beyond the newest KEPT_REPORTS, from any session."""
+        with self._rotate_lock:
+            reports = []
+            for path in self.reports_dir.glob("pytest_report_*.json"):
+                try:
+                    reports.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    continue
+            reports.sort(reverse=True)
+            for _, path in reports[KEPT_REPORTS:]:
+                path.unlink(missing_ok=True)
+
+    async def execute_pytest(
+        self, cmd: list[str], env: dict[str, str] | None = None
+    ) -> tuple[int, str, str]:
+        """
+        Run a pytest command line, reusing the preloaded forkserver if possible.
+
+        Output is shown live as it arrives; only the last OUTPUT_TAIL_LINES
+        lines are kept and returned, with stderr merged into stdout.
+
+        Args:
+            cmd: Full ``python -m pytest ...`` command
+            env: Extra environment variables for the run
+
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+
+        Raises:
+            TimeoutError: If the run exceeds TEST_TIMEOUT
+        """
+        env = env or {}
+        tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        if self._mp_context is None:
+            returncode = await self._execute_subprocess(cmd, env, tail)
+            return returncode, "".join(tail), ""
+
+        parent_conn, child_conn = self._mp_context.Pipe(duplex=False)
+        # Skip 'python -m pytest'; the child calls pytest.main directly. It is
+        # not daemonic, so tests in it may start processes of their own
+        process = self._mp_context.Process(
+            target=_run_pytest_in_child,
+            args=(cmd[3:], str(self.project_root), env, child_conn),
+        )
+        process.start()
+        child_conn.close()
+
+        # Wake the event loop whenever the child has sent something
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        loop.add_reader(parent_conn.fileno(), readable.set)
+
+        returncode = None
+        finished = False
+        try:
+            async with asyncio.timeout(TEST_TIMEOUT):
+                while returncode is None:
+                    while not parent_conn.poll():
+                        readable.clear()
+                        await readable.wait()
+                    kind, payload = parent_conn.recv()
+                    if kind == "output":
+                        self._emit_output(payload, tail)
+                    else:
+                        returncode = payload
+            finished = True
+        except EOFError:
+            # Child died before reporting (e.g. a test called os._exit)
+            finished = True
+        finally:
+            loop.remove_reader(parent_conn.fileno())
+            parent_conn.close()
+            # Terminate the child if it timed out, was cancelled or failed
+            # while still running
+            await self._reap_child(process, terminate=not finished)
+
+        if returncode is None:
+            returncode = process.exitcode or 1
+        return returncode, "".join(tail), ""
+
+    @staticmethod
+    async def _reap_child(process: multiprocessing.Process, terminate: bool) -> None:
+        """
+        Wait for a pytest child to exit, killing it if it lingers.
+
+        The joins run in the default executor so other test groups sharing
+        the event loop keep running while a slow child exits.
+
+        Args:
+            process: The pytest child
+            terminate: Ask an unfinished child to stop before waiting
+        """
+        loop = asyncio.get_running_loop()
+        if terminate:
+            process.terminate()
+        await loop.run_in_executor(None, process.join, 5.0)
+        if process.is_alive():
+            process.kill()
+            await loop.run_in_executor(None, process.join)
+
+    async def _execute_subprocess(
+        self, cmd: list[str], env: dict[str, str], tail: deque[str]
+    ) -> int:
+        """Run cmd in a fresh interpreter, draining its output into tail."""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=self.project_root,
+            env={**os.environ, **env},
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+
+        # Read in chunks rather than lines: a test may print a single line
+        # far longer than the stream reader's line limit
+        pending = b""
+        try:
+            async with asyncio.timeout(TEST_TIMEOUT):
+                while chunk := await process.stdout.read(64 * 1024):
+                    lines, _, pending = (pending + chunk).rpartition(b"\n")
+                    if lines:
+                        text = (lines + b"\n").decode(errors="replace")
+                        self._emit_output(text, tail)
+                if pending:
+                    self._emit_output(pending.decode(errors="replace"), tail)
+                return await process.wait()
+        finally:
+            # Timed out, cancelled or failed: never leave pytest running
+            if process.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    process.kill()
+                await process.wait()
+
+    def _emit_output(self, text: str, tail: deque[str]) -> None:
+        """Show pytest output live and keep its most recent lines."""
+        logger.info(text.rstrip("\n"))
+        tail.extend(text.splitlines(keepends=True))
+
     def parse_test_results(
         self,
         report_file: Path,
@@ -437,6 +1218,7 @@ class TestExecutor:
         stdout: str = "",
         stderr: str = "",
         returncode: int = 0,
+        coverage_report: Path | None = None,
     ) -> TestResult:
         """
         Parse pytest JSON report and create TestResult.
@@ -449,14 +1231,14 @@ class TestExecutor:
             stdout: pytest stdout output
             stderr: pytest stderr output
             returncode: pytest return code
+            coverage_report: Path to the coverage.py JSON report, if measured
 
         Returns:
             Parsed TestResult object
         """
         try:
             if report_file.exists():
-                with open(report_file) as f:
-                    report_data = json.load(f)
+                report_data = load_json_file(report_file)
 
                 # Extract basic test counts
                 summary = report_data.get("summary", {})
@@ -479,18 +1261,11 @@ class TestExecutor:
                         error_msg = call_info.get("longrepr", "No details available")
                         failure_details.append(f"{test_name}: {error_msg}")
 
-                # Try to extract coverage
+                # Exact total from the coverage.py JSON report
                 coverage_percent = None
-                if "coverage" in stdout or "TOTAL" in stdout:
-                    # Try to parse coverage from stdout
-                    for line in stdout.split("\n"):
-                        if "TOTAL" in line and "%" in line:
-                            try:
-                                # Extract percentage from line like "TOTAL   95%"
-                                coverage_str = line.split("%")[0].split()[-1]
-                                coverage_percent = float(coverage_str)
-                            except:
-                                pass
+                if coverage_report and coverage_report.exists():
+                    coverage_data = load_json_file(coverage_report)
+                    coverage_percent = coverage_data["totals"]["percent_covered"]
 
                 success = failed == 0 and errors == 0 and returncode == 0
 
@@ -510,7 +1285,7 @@ class TestExecutor:
                 )
 
         except Exception as e:
-            print(f"{Fore.RED}Error parsing test results: {e}")
+            logger.error(f"{Fore.RED}Error parsing test results: {e}")
 
         # Fallback result if parsing fails
         return TestResult(
@@ -529,6 +1304,38 @@ class TestExecutor:
             execution_error="PARSE_ERROR",
         )
 
+    def merge_test_results(self, results: list[TestResult]) -> TestResult:
+        """
+        Combine the results of concurrent runs into one summary.
+
+        Args:
+            results: TestResults from runs that executed side by side
+
+        Returns:
+            Single TestResult covering all runs
+        """
+        if len(results) == 1:
+            return results[0]
+
+        errors = [r.execution_error for r in results if r.execution_error]
+        return TestResult(
+            success=all(r.success for r in results),
+            total_tests=sum(r.total_tests for r in results),
+            passed=sum(r.passed for r in results),
+            failed=sum(r.failed for r in results),
+            skipped=sum(r.skipped for r in results),
+            errors=sum(r.errors for r in results),
+            # Runs overlap, so the slowest one is the wall-clock duration
+            duration_seconds=max(r.duration_seconds for r in results),
+            # Per-run percentages measure different files and cannot be summed
+            coverage_percent=None,
+            test_file=" ".join(r.test_file for r in results),
+            triggered_by=results[0].triggered_by,
+            timestamp=min(r.timestamp for r in results),
+            failure_details=[d for r in results for d in r.failure_details][:5],
+            execution_error="; ".join(errors) if errors else None,
+        )
+
     def display_test_result(self, result: TestResult) -> None:
         """
         Display test results with colored output.
@@ -536,6 +1343,9 @@ class TestExecutor:
         Args:
             result: TestResult to display
         """
+        # Failures stay visible with --quiet, which hides INFO output
+        log = logger.info if result.success else logger.warning
+
         # Header
         if result.success:
             status_color = Fore.GREEN
@@ -544,38 +1354,39 @@ class TestExecutor:
             status_color = Fore.RED
             status_icon = "[FAIL]"
 
-        print(f"\n{Back.BLUE}{Fore.WHITE} TEST EXECUTION COMPLETE {Style.RESET_ALL}")
-        print(f"{status_color}{status_icon} {result.test_file}")
-        print(f"{Fore.CYAN}Triggered by: {result.triggered_by}")
-        print(f"{Fore.CYAN}Duration: {result.duration_seconds:.2f}s")
-        print(f"{Fore.CYAN}Timestamp: {result.timestamp.strftime('%H:%M:%S')}")
+        log(f"\n{Back.BLUE}{Fore.WHITE} TEST EXECUTION COMPLETE {Style.RESET_ALL}")
+        log(f"{status_color}{status_icon} {result.test_file}")
+        log(f"{Fore.CYAN}Triggered by: {result.triggered_by}")
+        log(f"{Fore.CYAN}Duration: {result.duration_seconds:.2f}s")
+        log(f"{Fore.CYAN}Timestamp: {result.timestamp.strftime('%H:%M:%S')}")
 
         # Test counts
-        print(f"\n{Fore.CYAN}Test Results:")
-        print(f"{Fore.GREEN}  Passed: {result.passed}")
-        print(f"{Fore.RED}  Failed: {result.failed}")
-        print(f"{Fore.YELLOW}  Skipped: {result.skipped}")
-        print(f"{Fore.MAGENTA}  Errors: {result.errors}")
-        print(f"{Fore.BLUE}  Total: {result.total_tests}")
+        log(f"\n{Fore.CYAN}Test Results:")
+        log(f"{Fore.GREEN}  Passed: {result.passed}")
+        log(f"{Fore.RED}  Failed: {result.failed}")
+        log(f"{Fore.YELLOW}  Skipped: {result.skipped}")
+        log(f"{Fore.MAGENTA}  Errors: {result.errors}")
+        log(f"{Fore.BLUE}  Total: {result.total_tests}")
 
         # Coverage
         if result.coverage_percent is not None:
             coverage_color = (
                 Fore.GREEN if result.coverage_percent >= 80 else Fore.YELLOW
             )
-            print(f"{coverage_color}  Coverage: {result.coverage_percent:.1f}%")
+            log(f"{coverage_color}  Coverage: {result.coverage_percent:.1f}%")
 
         # Failure details
         if result.failure_details:
-            print(f"\n{Fore.RED}Failure Details:")
+            log(f"\n{Fore.RED}Failure Details:")
             for i, detail in enumerate(result.failure_details[:3], 1):  # Show max 3
-                print(f"{Fore.RED}  {i}. {detail[:100]}...")  # Truncate long messages
+                # Truncate long messages
+                log(f"{Fore.RED}  {i}. {detail[:100]}...")
 
         # Execution error
         if result.execution_error:
-            print(f"\n{Fore.RED}Execution Error: {result.execution_error}")
+            logger.error(f"\n{Fore.RED}Execution Error: {result.execution_error}")
 
-        print(f"{Style.DIM}{'-' * 60}")
+        log(f"{Style.DIM}{'-' * 60}")
 
 
 class FileWatcher:
@@ -591,6 +1402,10 @@ class FileWatcher:
         project_root: Path | None = None,
         debounce_delay: float = 2.0,
         enable_auto_tests: bool = True,
+        poll_interval: float | None = None,
+        serial: bool = False,
+        full: bool = False,
+        coverage_every: int = 0,
     ):
         """
         Initialize the FileWatcher.
@@ -599,16 +1414,40 @@ class FileWatcher:
             project_root: Root directory of the project (auto-detected if None)
             debounce_delay: Seconds to wait after last change before triggering
             enable_auto_tests: Whether to automatically run tests on file changes
+            poll_interval: Seconds between scans if the watcher has to fall back
+                to polling (defaults to DM_WATCH_INTERVAL or 5 seconds)
+            serial: Run all selected tests in one pytest session instead of one
+                concurrent session per project area
+            full: Run every selected test instead of only those pytest-testmon
+                finds affected
+            coverage_every: Measure coverage on every Nth test trigger
+                (0 never measures it while watching)
         """
         self.project_root = project_root or Path.cwd()
         self.debounce_delay = debounce_delay
         self.enable_auto_tests = enable_auto_tests
-        self.observer: Observer | None = None
+        self.serial = serial
+        self.coverage_every = coverage_every
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else float(os.environ.get("DM_WATCH_INTERVAL", 5.0))
+        )
+        self.observer: BaseObserver | _InotifyObserver | None = None
         self.is_watching = False
+        self._stop_event = threading.Event()
+        self._stopped = threading.Event()
+        self._stop_lock = threading.Lock()
+
+        # Startup checks run from several places; see invalidate_cache()
+        self._validated: bool | None = None
+        self._monitored_paths: list[Path] | None = None
+        self._root_entries: dict[str, bool] | None = None
 
         # Statistics tracking
-        self.start_time: datetime | None = None
-        self.events_detected = 0
+        self.start_time: float | None = None  # time.monotonic() at start
+        # Wall-clock time of monotonic zero, for displaying event timestamps
+        self._boot_epoch = time.time() - time.monotonic()
         self.events_processed = 0
         self.tests_executed = 0
         self.tests_passed = 0
@@ -619,12 +1458,16 @@ class FileWatcher:
 
         # Initialize test executor
         self.test_executor = (
-            TestExecutor(self.project_root) if enable_auto_tests else None
+            TestExecutor(self.project_root, incremental=not full)
+            if enable_auto_tests
+            else None
         )
 
         # Create file handler
         self.file_handler = DrawingMachineFileHandler(
-            callback=self.handle_file_change, debounce_delay=debounce_delay
+            callback=self.handle_file_changes,
+            debounce_delay=debounce_delay,
+            project_root=self.project_root,
         )
 
         print(
@@ -643,21 +1486,27 @@ class FileWatcher:
         Returns:
             True if project structure is valid, False otherwise
         """
+        if self._validated is not None:
+            return self._validated
+
         required_indicators = [
             self.project_root / "pyproject.toml",
             self.project_root / "shared",
             self.project_root / "tests",
         ]
 
-        missing = [path for path in required_indicators if not path.exists()]
+        entries = self._scan_project_root()
+        missing = [path for path in required_indicators if path.name not in entries]
 
         if missing:
             print(f"{Fore.RED}Invalid project structure. Missing:")
             for path in missing:
                 print(f"{Fore.RED}   - {path}")
+            self._validated = False
             return False
 
         print(f"{Fore.GREEN}Drawing Machine project structure validated")
+        self._validated = True
         return True
 
     def get_monitored_paths(self) -> list[Path]:
@@ -667,28 +1516,103 @@ class FileWatcher:
         Returns:
             List of existing paths to monitor
         """
+        if self._monitored_paths is not None:
+            return list(self._monitored_paths)
+
+        entries = self._scan_project_root()
         paths = []
         for dir_name in self.monitored_dirs:
             dir_path = self.project_root / dir_name
-            if dir_path.exists() and dir_path.is_dir():
+            if entries.get(dir_name, False):
                 paths.append(dir_path)
                 print(f"{Fore.BLUE} Monitoring: {dir_path}")
             else:
                 print(f"{Fore.YELLOW}  Directory not found: {dir_path}")
 
-        return paths
+        self._monitored_paths = paths
+        return list(paths)
+
+    def _scan_project_root(self) -> dict[str, bool]:
+        """
+        Map each entry in the project root to whether it is a directory.
+
+        A single scandir answers every existence and type check made at
+        startup, instead of one stat call per candidate path.
+        """
+        if self._root_entries is None:
+            try:
+                with os.scandir(self.project_root) as it:
+                    self._root_entries = {entry.name: entry.is_dir() for entry in it}
+            except OSError:
+                self._root_entries = {}
+        return self._root_entries
+
+    def invalidate_cache(self) -> None:
+        """Forget the project validation and monitored paths found earlier."""
+        self._validated = None
+        self._monitored_paths = None
+        self._root_entries = None
+
+    def handle_file_changes(self, events: list[FileChangeEvent]) -> None:
+        """
+        Handle the file changes settled in one debounce window.
+
+        Every change is reported, then the tests for all of them run together.
+
+        Args:
+            events: FileChangeEvents released together by the debouncer
+        """
+        for event in events:
+            self.report_file_change(event)
+
+        # Without auto-tests the changes only need reporting
+        if not self.test_executor:
+            return
+
+        # A test file appeared or vanished, so mapped test existence may be stale
+        if any(
+            event.is_test_file and event.event_type != "modified" for event in events
+        ):
+            self.test_executor.invalidate_test_cache()
+
+        # Step 3.2: Trigger automatic test execution
+        changed = [event for event in events if event.event_type != "deleted"]
+        if changed:
+            self.trigger_tests(changed)
 
     def handle_file_change(self, event: FileChangeEvent) -> None:
         """
-        Handle a debounced file change event.
+        Handle a single debounced file change event.
+
+        Args:
+            event: FileChangeEvent containing change details
+        """
+        self.handle_file_changes([event])
+
+    @property
+    def events_detected(self) -> int:
+        """File events the handler has seen, counted on the observer thread."""
+        return self.file_handler.events_detected
+
+    def event_time(self, event: FileChangeEvent) -> time.struct_time:
+        """Convert an event's monotonic timestamp to local wall-clock time."""
+        return time.localtime(self._boot_epoch + event.timestamp / 1e9)
+
+    def report_file_change(self, event: FileChangeEvent) -> None:
+        """
+        Display a file change event.
 
         Args:
             event: FileChangeEvent containing change details
         """
         self.events_processed += 1
 
+        # Skip all the formatting below when nobody will see it (--quiet)
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         # Format timestamp
-        timestamp = event.timestamp.strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S", self.event_time(event))
 
         # Choose color and icon based on event type
         if event.event_type == "created":
@@ -712,83 +1636,112 @@ class FileWatcher:
         # Format file type
         file_type = "Test File" if event.is_test_file else "Source File"
 
-        print(f"{color}{icon} File {event.event_type}: {event.file_path}")
-        print(f"{color}    Area: {area_desc}")
-        print(f"{color}     Type: {file_type}")
-        print(f"{color}    Time: {timestamp}")
-        print(f"{color}    Events: {self.events_processed}/{self.events_detected}")
+        logger.info(f"{color}{icon} File {event.event_type}: {event.file_path}")
+        logger.info(f"{color}    Area: {area_desc}")
+        logger.info(f"{color}     Type: {file_type}")
+        logger.info(f"{color}    Time: {timestamp}")
+        logger.info(
+            f"{color}    Events: {self.events_processed}/{self.events_detected}"
+        )
 
         # Add separator for readability
-        print(f"{Style.DIM}{'-' * 60}")
-
-        # Step 3.2: Trigger automatic test execution
-        if self.enable_auto_tests and event.event_type != "deleted":
-            self.trigger_tests(event)
+        logger.info(f"{Style.DIM}{'-' * 60}")
 
-    def trigger_tests(self, event: FileChangeEvent) -> None:
+    def trigger_tests(self, events: list[FileChangeEvent]) -> None:
         """
-        Trigger appropriate tests based on the file change event.
+        Run the tests for a batch of file changes in a single pytest session.
 
         Args:
-            event: FileChangeEvent that triggered the test execution
+            events: FileChangeEvents that triggered the test execution
         """
         if not self.test_executor:
-            print(f"{Fore.YELLOW}Test execution disabled - skipping tests")
+            logger.info(f"{Fore.YELLOW}Test execution disabled - skipping tests")
             return
 
-        # Determine which tests to run
-        test_paths = self.test_executor.determine_tests_for_file(event.file_path)
-
-        if not test_paths:
-            print(f"{Fore.YELLOW}No tests found for {event.file_path} - skipping")
+        # Tests selected for every changed file, grouped by project area
+        groups: dict[str, list[str]] = {}
+        selected_paths: set[str] = set()
+        for event in events:
+            selected = self.test_executor.determine_tests_for_file(event.file_path)
+            if not selected:
+                logger.info(
+                    f"{Fore.YELLOW}No tests found for {event.file_path} - skipping"
+                )
+            group = groups.setdefault(event.project_area, [])
+            for test_path in selected:
+                if test_path not in selected_paths:
+                    selected_paths.add(test_path)
+                    group.append(test_path)
+
+        groups = {area: paths for area, paths in groups.items() if paths}
+        if not groups:
             return
+        if self.serial:
+            groups = {"all": [path for paths in groups.values() for path in paths]}
 
-        print(f"{Fore.MAGENTA}Test trigger: {len(test_paths)} test suite(s) selected")
-        for test_path in test_paths:
-            print(f"{Fore.MAGENTA}  - {test_path}")
+        logger.info(
+            f"{Fore.MAGENTA}Test trigger: {len(selected_paths)} test suite(s) "
+            f"selected in {len(groups)} run(s)"
+        )
+        for area, paths in groups.items():
+            for test_path in paths:
+                logger.info(f"{Fore.MAGENTA}  - [{area}] {test_path}")
+
+        # Execute tests; coverage tracing slows runs, so only measure it periodically
+        self.tests_executed += 1
+        with_coverage = (
+            self.coverage_every > 0 and self.tests_executed % self.coverage_every == 0
+        )
+        triggered_by = ", ".join(str(event.file_path) for event in events)
 
-        # Execute tests
-        for test_path in test_paths:
-            self.tests_executed += 1
+        try:
+            results = asyncio.run(
+                self._run_groups(list(groups.values()), with_coverage, triggered_by)
+            )
+            result = self.test_executor.merge_test_results(results)
 
-            try:
-                # Run the test
-                result = self.test_executor.run_tests(
-                    test_path=test_path, with_coverage=True
-                )
+            # Update statistics
+            if result.success:
+                self.tests_passed += 1
+            else:
+                self.tests_failed += 1
 
-                # Update statistics
-                if result.success:
-                    self.tests_passed += 1
-                else:
-                    self.tests_failed += 1
+            # Display results
+            self.test_executor.display_test_result(result)
 
-                # Display results
-                self.test_executor.display_test_result(result)
+        except Exception as e:
+            self.tests_failed += 1
+            logger.error(f"{Fore.RED}Test execution error: {e}")
 
-                # Brief summary for multi-test runs
-                if len(test_paths) > 1:
-                    status = "PASSED" if result.success else "FAILED"
-                    print(
-                        f"{Fore.CYAN}Test suite {status}: {test_path} "
-                        f"({result.passed}/{result.total_tests} passed)"
-                    )
+        logger.info(f"{Fore.GREEN}Monitoring continues... (Ctrl+C to stop)")
+        logger.info("")
 
-            except Exception as e:
-                self.tests_failed += 1
-                print(f"{Fore.RED}Test execution error for {test_path}: {e}")
+    async def _run_groups(
+        self, groups: list[list[str]], with_coverage: bool, triggered_by: str
+    ) -> list[TestResult]:
+        """
+        Run each group of tests in its own pytest session, concurrently.
+
+        Args:
+            groups: Test paths per pytest session
+            with_coverage: Whether to include coverage analysis
+            triggered_by: Changed files that caused the runs
 
-        # Multi-test summary
-        if len(test_paths) > 1:
-            passed_suites = sum(1 for _ in test_paths if self.tests_passed > 0)
-            print(f"\n{Back.CYAN}{Fore.WHITE} MULTI-TEST SUMMARY {Style.RESET_ALL}")
-            print(f"{Fore.CYAN}Test suites executed: {len(test_paths)}")
-            print(f"{Fore.GREEN}Suites passed: {passed_suites}")
-            print(f"{Fore.RED}Suites failed: {len(test_paths) - passed_suites}")
-            print(f"{Style.DIM}{'-' * 60}")
+        Returns:
+            TestResults in the same order as groups
+        """
+        # Cap concurrent sessions at the CPU count to avoid oversubscription
+        slots = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async def run_group(test_paths: list[str]) -> TestResult:
+            async with slots:
+                return await self.test_executor.run_tests_async(
+                    test_path=test_paths,
+                    with_coverage=with_coverage,
+                    triggered_by=triggered_by,
+                )
 
-        print(f"{Fore.GREEN}Monitoring continues... (Ctrl+C to stop)")
-        print()
+        return await asyncio.gather(*(run_group(paths) for paths in groups))
 
     def display_startup_banner(self):
         """Display startup banner with project information."""
@@ -815,7 +1768,14 @@ class FileWatcher:
         print(f"{Fore.YELLOW}  Configuration:")
         print(f"{Fore.YELLOW}   • Debounce delay: {self.debounce_delay}s")
         print(f"{Fore.YELLOW}   • File types: Python (.py)")
+        if self.coverage_every:
+            print(f"{Fore.YELLOW}   • Coverage: every {self.coverage_every} run(s)")
         print(f"{Fore.YELLOW}   • Ignoring: __pycache__, .git, node_modules, etc.")
+        if self.test_executor:
+            selection = (
+                "affected only (testmon)" if self.test_executor.use_testmon else "full"
+            )
+            print(f"{Fore.YELLOW}   • Test selection: {selection}")
         print(f"{Fore.CYAN}{'=' * 60}")
         print(f"{Fore.GREEN} FileWatcher is now monitoring for changes...")
         print(f"{Fore.GREEN} Press Ctrl+C to stop monitoring\n")
@@ -823,8 +1783,8 @@ class FileWatcher:
     def display_statistics(self):
         """Display monitoring statistics."""
         if self.start_time:
-            duration = datetime.now() - self.start_time
-            duration_str = str(duration).split(".")[0]  # Remove microseconds
+            duration = timedelta(seconds=int(time.monotonic() - self.start_time))
+            duration_str = str(duration)
 
             print(f"\n{Fore.CYAN} FileWatcher Statistics:")
             print(f"{Fore.CYAN}     Running time: {duration_str}")
@@ -853,6 +1813,10 @@ class FileWatcher:
         Begins monitoring the specified directories for Python file changes.
         Handles setup, validation, and graceful shutdown.
         """
+        # A stopped watcher may be started again
+        self._stop_event.clear()
+        self._stopped.clear()
+
         try:
             # Validate project structure
             if not self.validate_project_structure():
@@ -870,24 +1834,19 @@ class FileWatcher:
             # Display startup information
             self.display_startup_banner()
 
-            # Initialize observer
-            self.observer = Observer()
-
-            # Add watches for each monitored directory
-            for path in monitored_paths:
-                self.observer.schedule(self.file_handler, str(path), recursive=True)
-
             # Start monitoring
-            self.observer.start()
+            self.observer = self.start_observer(monitored_paths)
             self.is_watching = True
-            self.start_time = datetime.now()
+            self.start_time = time.monotonic()
 
             try:
-                while self.is_watching:
-                    time.sleep(1)
-                    # Track events for statistics
-                    # Note: This is a simple approximation
-                    # In a real implementation, we'd get actual event counts from the observer
+                # Wait for stop_watching() or Ctrl+C. Ctrl+C interrupts an
+                # untimed wait on POSIX but not on Windows, which needs slices
+                if sys.platform == "win32":
+                    while not self._stop_event.wait(1.0):
+                        pass
+                else:
+                    self._stop_event.wait()
 
             except KeyboardInterrupt:
                 print(
@@ -903,16 +1862,103 @@ class FileWatcher:
 
         return True
 
+    def start_observer(
+        self, monitored_paths: list[Path]
+    ) -> "BaseObserver | _InotifyObserver":
+        """
+        Start a kernel-notification observer, falling back to polling.
+
+        The native observer (inotify on Linux) can fail at start-up on network
+        mounts or once the per-user watch limit is exhausted. In that case the
+        directories are polled every ``poll_interval`` seconds instead.
+
+        Args:
+            monitored_paths: Directories to watch recursively
+
+        Returns:
+            The running observer
+        """
+        observer = self._make_observer()
+        try:
+            self._schedule_paths(observer, monitored_paths)
+            observer.start()
+            print(f"{Fore.BLUE} File notifications: {type(observer).__name__}")
+            return observer
+        except OSError as e:
+            observer.unschedule_all()
+            print(
+                f"{Fore.YELLOW}  Native file notifications unavailable ({e}) - "
+                f"polling every {self.poll_interval}s"
+            )
+
+        from watchdog.observers.polling import PollingObserver
+
+        observer = PollingObserver(timeout=self.poll_interval)
+        self._schedule_paths(observer, monitored_paths)
+        observer.start()
+        print(f"{Fore.BLUE} File notifications: {type(observer).__name__}")
+        return observer
+
+    @staticmethod
+    def _make_observer() -> "BaseObserver | _InotifyObserver":
+        """Construct this platform's kernel-notification observer explicitly."""
+        from watchdog.observers import Observer
+
+        if sys.platform.startswith("linux"):
+            try:
+                return _InotifyObserver()
+            except (AttributeError, OSError):
+                # No usable libc inotify symbols (e.g. a static build)
+                from watchdog.observers.inotify import InotifyObserver
+
+                return InotifyObserver()
+        if sys.platform == "darwin":
+            try:
+                from watchdog.observers.fsevents import FSEventsObserver
+            except ImportError:
+                # FSEvents needs the compiled extension; kqueue is the default then
+                return Observer()
+            return FSEventsObserver()
+        return Observer()
+
+    def _schedule_paths(
+        self, observer: "BaseObserver | _InotifyObserver", monitored_paths: list[Path]
+    ) -> None:
+        """Register recursive watches limited to file content changes."""
+        for path in monitored_paths:
+            observer.schedule(
+                self.file_handler,
+                str(path),
+                recursive=True,
+                event_filter=WATCHED_EVENT_TYPES,
+            )
+
     def stop_watching(self):
         """
         Stop the file watcher gracefully.
 
-        Stops the observer, cancels pending timers, and displays final statistics.
+        Stops the observer, cancels pending changes, and displays final statistics.
+        Safe to call more than once or from several threads; only the first
+        call does the work.
         """
+        if self._stopped.is_set():
+            return
+        with self._stop_lock:
+            if self._stopped.is_set():
+                return
+            self._stopped.set()
+
+        self._stop_event.set()
+
         if self.observer and self.observer.is_alive():
             print(f"{Fore.YELLOW}  Stopping file observer...")
             self.observer.stop()
-            self.observer.join(timeout=5.0)
+
+            # Short joins keep Ctrl+C responsive on Windows, where a long
+            # join cannot be interrupted
+            deadline = time.monotonic() + 5.0
+            while self.observer.is_alive() and time.monotonic() < deadline:
+                self.observer.join(timeout=0.05)
 
             if self.observer.is_alive():
                 print(f"{Fore.RED}  Observer did not stop gracefully")
@@ -920,13 +1966,9 @@ class FileWatcher:
                 print(f"{Fore.GREEN} Observer stopped successfully")
 
         # Cancel any pending debounced changes
-        with self.file_handler.lock:
-            pending_count = len(self.file_handler.pending_changes)
-            if pending_count > 0:
-                print(f"{Fore.YELLOW} Cancelling {pending_count} pending changes...")
-                for timer in self.file_handler.pending_changes.values():
-                    timer.cancel()
-                self.file_handler.pending_changes.clear()
+        pending_count = self.file_handler.debouncer.stop()
+        if pending_count > 0:
+            print(f"{Fore.YELLOW} Cancelling {pending_count} pending changes...")
 
         self.is_watching = False
 
@@ -939,12 +1981,17 @@ class FileWatcher:
 
 
 # Test and demonstration functions
-def test_file_watcher():
-    """Test function to validate FileWatcher functionality."""
-    print(f"{Fore.CYAN} Testing FileWatcher functionality...")
+def _validate_environment(watcher: FileWatcher) -> bool:
+    """
+    Check the project structure and monitored paths a watcher depends on.
 
-    # Test project structure validation
-    watcher = FileWatcher()
+    Args:
+        watcher: Watcher to check; its cached results are reused when it
+            starts watching
+
+    Returns:
+        True if the watcher has a valid project and something to monitor
+    """
     is_valid = watcher.validate_project_structure()
 
     if is_valid:
@@ -953,7 +2000,7 @@ def test_file_watcher():
         print(f"{Fore.RED} Project structure validation: FAILED")
         return False
 
-    # Test monitored paths
+    # Check monitored paths
     monitored_paths = watcher.get_monitored_paths()
     if monitored_paths:
         print(
@@ -963,6 +2010,17 @@ def test_file_watcher():
         print(f"{Fore.RED} Monitored paths detection: FAILED")
         return False
 
+    return True
+
+
+def test_file_watcher():
+    """Test function to validate FileWatcher functionality."""
+    print(f"{Fore.CYAN} Testing FileWatcher functionality...")
+
+    watcher = FileWatcher()
+    if not _validate_environment(watcher):
+        return False
+
     # Test file filtering
     test_files = [
         Path("shared/models/blockchain_data.py"),  # Should monitor
@@ -1004,21 +2062,21 @@ def demo_file_changes():
         FileChangeEvent(
             file_path=Path("shared/models/blockchain_data.py"),
             event_type="modified",
-            timestamp=datetime.now(),
+            timestamp=time.monotonic_ns(),
             project_area="shared",
             is_test_file=False,
         ),
         FileChangeEvent(
             file_path=Path("tests/unit/test_blockchain_data.py"),
             event_type="modified",
-            timestamp=datetime.now(),
+            timestamp=time.monotonic_ns(),
             project_area="tests",
             is_test_file=True,
         ),
         FileChangeEvent(
             file_path=Path("edge/controllers/motor_controller.py"),
             event_type="created",
-            timestamp=datetime.now(),
+            timestamp=time.monotonic_ns(),
             project_area="edge",
             is_test_file=False,
         ),
@@ -1044,6 +2102,7 @@ if __name__ == "__main__":
     Provides options for testing, demonstration, or normal operation.
     """
     import argparse
+    import atexit
 
     parser = argparse.ArgumentParser(
         description="Drawing Machine FileWatcher - Automatic Test Integration System"
@@ -1068,9 +2127,42 @@ if __name__ == "__main__":
     parser.add_argument(
         "--run-test", type=str, help="Run a specific test file manually and exit"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only report failures and warnings while watching",
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run all selected tests in one pytest session instead of one per area",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Run every selected test, even if pytest-testmon is installed",
+    )
+    parser.add_argument(
+        "--coverage-every",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Measure coverage on every Nth automatic test run (default: never)",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="Polling interval in seconds if native file notifications are "
+        "unavailable (default: DM_WATCH_INTERVAL or 5.0)",
+    )
 
     args = parser.parse_args()
 
+    atexit.register(
+        configure_logging(logging.WARNING if args.quiet else logging.INFO).stop
+    )
+
     if args.test:
         # Run tests
         success = test_file_watcher()
@@ -1087,7 +2179,7 @@ if __name__ == "__main__":
         print(f"{Fore.MAGENTA}   Manual Test Execution")
 
         project_root = Path.cwd()
-        test_executor = TestExecutor(project_root)
+        test_executor = TestExecutor(project_root, incremental=not args.full)
 
         result = test_executor.run_tests(test_path=args.run_test, with_coverage=True)
         test_executor.display_test_result(result)
@@ -1102,15 +2194,19 @@ if __name__ == "__main__":
 
         enable_auto_tests = not args.no_auto_tests
         watcher = FileWatcher(
-            debounce_delay=args.debounce, enable_auto_tests=enable_auto_tests
+            debounce_delay=args.debounce,
+            enable_auto_tests=enable_auto_tests,
+            poll_interval=args.poll_interval,
+            serial=args.serial,
+            full=args.full,
+            coverage_every=args.coverage_every,
         )
 
         # Validate environment before starting
-        if not test_file_watcher():
+        if not _validate_environment(watcher):
             print(f"{Fore.RED} Environment validation failed")
             sys.exit(1)
 
         # Start watching
         success = watcher.start_watching()
         sys.exit(0 if success else 1)
-
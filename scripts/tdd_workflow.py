@@ -39,7 +39,7 @@ class WorkflowPhase(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Individual test result data structure."""
 
@@ -51,7 +51,7 @@ class TestResult:
     coverage_percent: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSuiteResult:
     """Test suite execution results."""
 
@@ -67,7 +67,7 @@ class TestSuiteResult:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentSpecification:
     """Component specification for test generation."""
 
@@ -417,7 +417,7 @@ Generated by TDD Workflow Manager.
 Minimal implementation to start passing tests.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import ClassVar, Dict, Any, Optional, List
 from pydantic import BaseModel, Field, computed_field, field_validator
 from datetime import datetime
 import uuid
@@ -440,6 +440,15 @@ class {class_name}(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     timestamp: float = Field(default_factory=lambda: datetime.now().timestamp())
     
+    # Output-only names stripped by the *_json_safe helpers; subclasses
+    # recompute it from model_computed_fields
+    _COMPUTED_FIELDS: ClassVar[frozenset[str]] = frozenset({{"created_at"}})
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._COMPUTED_FIELDS = frozenset(cls.model_computed_fields)
+    
     @computed_field
     @property
     def created_at(self) -> str:
@@ -455,18 +464,18 @@ class {class_name}(BaseModel):
         else:
             data = json_data
         
-        computed_fields = {{"created_at"}}
-        filtered_data = {{k: v for k, v in data.items() if k not in computed_fields}}
+        filtered_data = {{
+            k: v for k, v in data.items() if k not in cls._COMPUTED_FIELDS
+        }}
         return cls.model_validate(filtered_data)
     
     def model_dump_json_safe(self, **kwargs):
         """Safe JSON dump that excludes computed fields."""
-        exclude_computed = {{"created_at"}}
-        exclude = kwargs.get('exclude', set())
+        exclude = kwargs.pop('exclude', None)
         if isinstance(exclude, set):
-            exclude = exclude.union(exclude_computed)
+            exclude = exclude | self._COMPUTED_FIELDS
         else:
-            exclude = exclude_computed
+            exclude = self._COMPUTED_FIELDS
         return self.model_dump_json(exclude=exclude, **kwargs)
     
     model_config = {{
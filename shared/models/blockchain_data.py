@@ -357,6 +357,28 @@ class EthereumDataSnapshot(BaseModel):
             "motor_pe": self.block_fullness_percent / 100,
         }
 
+    def to_broadcast_dict(self, block_number: int | None = None) -> dict:
+        """
+        Build the blockchain payload broadcast to web clients.
+
+        Args:
+            block_number: Block that triggered the broadcast; defaults to the
+                snapshot's own block number.
+
+        Returns:
+            Dict with the display metrics consumed by the frontend.
+        """
+        return {
+            "eth_price_usd": self.eth_price_usd,
+            "gas_price_gwei": self.gas_price_gwei,
+            "base_fee_gwei": self.base_fee_gwei,
+            "blob_space_utilization_percent": self.blob_space_utilization_percent,
+            "block_fullness_percent": self.block_fullness_percent,
+            "block_number": self.block_number if block_number is None else block_number,
+            "epoch": self.epoch,
+            "data_sources": self.data_sources,
+        }
+
     def is_valid_for_drawing(self) -> bool:
         """
         Check if data quality is sufficient for drawing operations.
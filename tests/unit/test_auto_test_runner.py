@@ -0,0 +1,370 @@
+"""
+Unit tests for the auto test runner file watching helpers.
+"""
+
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from watchdog.events import (
+    DirModifiedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEventHandler,
+)
+
+from scripts.auto_test_runner import (
+    KEPT_REPORTS,
+    CoalescedDebouncer,
+    DrawingMachineFileHandler,
+    FileWatcher,
+    _ConnectionWriter,
+    _InotifyObserver,
+)
+from scripts.auto_test_runner import TestExecutor as Executor
+from scripts.auto_test_runner import TestResult as RunResult
+
+
+class TestCoalescedDebouncer:
+    """Test the single-thread debouncer used by the file watcher."""
+
+    def test_repeated_keys_coalesce(self):
+        """Test that rapid changes to one key deliver only the latest value."""
+        delivered = []
+        done = threading.Event()
+
+        def callback(values):
+            delivered.extend(values)
+            done.set()
+
+        debouncer = CoalescedDebouncer(callback, delay=0.05)
+        for value in range(5):
+            debouncer.submit("shared/models/blockchain_data.py", value)
+
+        assert done.wait(timeout=2.0)
+        debouncer.stop()
+        assert delivered == [4]
+
+    def test_idle_key_fires_after_settle(self):
+        """Test that a first change fires quickly and a repeat waits the delay."""
+        delivered = []
+        fired = threading.Event()
+
+        def callback(values):
+            delivered.extend(values)
+            fired.set()
+
+        debouncer = CoalescedDebouncer(callback, delay=10.0, settle=0.05)
+        debouncer.submit("a.py", 1)
+        assert fired.wait(timeout=2.0)
+
+        debouncer.submit("a.py", 2)
+        time.sleep(0.2)
+        assert delivered == [1]
+        assert debouncer.stop() == 1
+
+    def test_overflow_drops_least_recent(self):
+        """Test that the pending map is capped by dropping the stalest key."""
+        debouncer = CoalescedDebouncer(lambda values: None, delay=10.0, max_pending=2)
+        debouncer.submit("a.py", "a")
+        debouncer.submit("b.py", "b")
+        debouncer.submit("a.py", "a2")
+        debouncer.submit("c.py", "c")
+
+        assert list(debouncer.pending) == ["a.py", "c.py"]
+        debouncer.stop()
+
+    def test_stop_cancels_pending(self):
+        """Test that stopping drops pending changes and reports the count."""
+        delivered = []
+        debouncer = CoalescedDebouncer(delivered.extend, delay=10.0)
+        debouncer.submit("a.py", "a")
+        debouncer.submit("b.py", "b")
+
+        assert debouncer.stop() == 2
+        assert debouncer.pending_count == 0
+        assert delivered == []
+
+
+class TestBatchedTestRuns:
+    """Test how the tests selected in one debounce window are executed."""
+
+    def run_batch(self, project_root, **watcher_kwargs):
+        """Feed one batch of changes to a watcher and record its pytest runs."""
+        (project_root / "tests" / "unit").mkdir(parents=True)
+        for test_file in ("test_edge_controllers.py", "test_cloud_services.py"):
+            (project_root / "tests" / "unit" / test_file).touch()
+
+        watcher = FileWatcher(project_root=project_root, **watcher_kwargs)
+        calls = []
+
+        async def fake_run_tests(test_path=None, with_coverage=True, triggered_by=None):
+            assert not with_coverage
+            calls.append(test_path)
+            return RunResult(
+                success=True,
+                total_tests=len(test_path),
+                passed=len(test_path),
+                failed=0,
+                skipped=0,
+                errors=0,
+                duration_seconds=0.0,
+                coverage_percent=None,
+                test_file=" ".join(test_path),
+                triggered_by=triggered_by,
+                timestamp=datetime.now(),
+                failure_details=[],
+            )
+
+        watcher.test_executor.run_tests_async = fake_run_tests
+        handler = watcher.file_handler
+        watcher.handle_file_changes(
+            [
+                handler.create_file_event(Path("edge/a.py"), "modified"),
+                handler.create_file_event(Path("edge/b.py"), "modified"),
+                handler.create_file_event(Path("cloud/c.py"), "created"),
+                handler.create_file_event(Path("shared/d.py"), "deleted"),
+            ]
+        )
+        return watcher, calls
+
+    def test_areas_run_concurrently(self, tmp_path):
+        """Test that each project area gets its own pytest run."""
+        watcher, calls = self.run_batch(tmp_path)
+
+        assert sorted(calls) == [
+            ["tests/unit/test_cloud_services.py"],
+            ["tests/unit/test_edge_controllers.py"],
+        ]
+        assert watcher.tests_executed == 1
+        assert watcher.tests_passed == 1
+
+    def test_serial_runs_union_once(self, tmp_path):
+        """Test that serial mode runs every selected test in a single call."""
+        watcher, calls = self.run_batch(tmp_path, serial=True)
+
+        assert calls == [
+            [
+                "tests/unit/test_edge_controllers.py",
+                "tests/unit/test_cloud_services.py",
+            ]
+        ]
+        assert watcher.tests_executed == 1
+
+
+class TestFileFiltering:
+    """Test which file changes the handler reports."""
+
+    def test_ignores_test_output_directories(self, tmp_path):
+        """Test that files written by test runs never trigger new runs."""
+        handler = DrawingMachineFileHandler(lambda events: None, project_root=tmp_path)
+
+        assert handler.should_ignore_file(tmp_path / "reports" / "pytest" / "x.py")
+        assert handler.should_ignore_file(tmp_path / "htmlcov" / "index.py")
+        assert not handler.should_ignore_file(tmp_path / "shared" / "models.py")
+
+    def test_ignore_patterns_match_whole_components(self, tmp_path):
+        """Test that ignored names only match complete path components."""
+        handler = DrawingMachineFileHandler(lambda events: None, project_root=tmp_path)
+
+        assert handler.should_ignore_file(Path("shared/__pycache__/models.py"))
+        assert handler.should_ignore_file(Path("pkg/foo.egg-info/setup.py"))
+        assert not handler.should_ignore_file(Path("shared/models/environment.py"))
+        assert not handler.should_ignore_file(Path("scripts/rebuild.py"))
+
+    def test_changes_to_one_file_merge_into_net_effect(self, tmp_path):
+        """Test that a settled file reports its net change, not its last one."""
+        delivered = []
+        done = threading.Event()
+
+        def callback(events):
+            delivered.extend(
+                (event.file_path.name, event.event_type) for event in events
+            )
+            done.set()
+
+        handler = DrawingMachineFileHandler(
+            callback, debounce_delay=0.05, project_root=tmp_path
+        )
+        handler.debounce_change(tmp_path / "new.py", "created")
+        handler.debounce_change(tmp_path / "new.py", "modified")
+        handler.debounce_change(tmp_path / "scratch.py", "created")
+        handler.debounce_change(tmp_path / "scratch.py", "deleted")
+        handler.debounce_change(tmp_path / "saved.py", "deleted")
+        handler.debounce_change(tmp_path / "saved.py", "created")
+
+        assert done.wait(timeout=2.0)
+        time.sleep(0.1)
+        handler.debouncer.stop()
+        assert sorted(delivered) == [("new.py", "created"), ("saved.py", "modified")]
+
+    def test_counts_ignored_events_as_detected(self, tmp_path):
+        """Test that every file event is detected, reported or not."""
+        handler = DrawingMachineFileHandler(lambda events: None, project_root=tmp_path)
+        handler.dispatch(FileModifiedEvent(str(tmp_path / "shared" / "models.py")))
+        handler.dispatch(FileModifiedEvent(str(tmp_path / "htmlcov" / "index.py")))
+        handler.dispatch(DirModifiedEvent(str(tmp_path / "shared")))
+        handler.debouncer.stop()
+
+        assert handler.events_detected == 2
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux only"
+)
+class TestInotifyObserver:
+    """Test the single-descriptor inotify observer."""
+
+    def test_new_directories_are_watched(self, tmp_path):
+        """Test that files in directories created after start are reported."""
+        seen = []
+        changed = threading.Event()
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                seen.append((event.event_type, event.src_path))
+                changed.set()
+
+        observer = _InotifyObserver()
+        observer.schedule(Handler(), str(tmp_path), recursive=True)
+        observer.start()
+        try:
+            (tmp_path / "shared").mkdir()
+            time.sleep(0.1)
+            changed.clear()
+            (tmp_path / "shared" / "models.py").write_text("x = 1\n")
+            assert changed.wait(timeout=2.0)
+        finally:
+            observer.stop()
+            observer.join(timeout=2.0)
+
+        assert not observer.is_alive()
+        assert ("modified", str(tmp_path / "shared" / "models.py")) in seen
+
+    def test_directories_moved_out_are_unwatched(self, tmp_path):
+        """Test that watches follow a directory tree moved out of the root."""
+        root = tmp_path / "root"
+        (root / "shared" / "models").mkdir(parents=True)
+
+        observer = _InotifyObserver()
+        observer.schedule(FileSystemEventHandler(), str(root), recursive=True)
+        observer.start()
+        try:
+            (root / "shared").rename(tmp_path / "elsewhere")
+            deadline = time.monotonic() + 2.0
+            while len(observer._watches) > 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            watched = list(observer._watches.values())
+        finally:
+            observer.stop()
+            observer.join(timeout=2.0)
+
+        assert watched == [str(root)]
+
+
+class TestWatcherLifecycle:
+    """Test starting and stopping the file watcher."""
+
+    def test_watcher_can_restart_after_stop(self):
+        """Test that a restarted watcher's observer is stopped again."""
+        watcher = FileWatcher(enable_auto_tests=False, debounce_delay=0.05)
+
+        for _ in range(2):
+            thread = threading.Thread(target=watcher.start_watching)
+            thread.start()
+            deadline = time.monotonic() + 5.0
+            while not watcher.is_watching and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert watcher.is_watching
+
+            watcher.stop_watching()
+            thread.join(timeout=5.0)
+            assert not thread.is_alive()
+            assert not watcher.observer.is_alive()
+
+
+class TestPytestOutput:
+    """Test how pytest output is streamed from the child process."""
+
+    def test_partial_lines_are_held_until_complete(self):
+        """Test that flushed fragments are sent as one complete line."""
+        sent = []
+        writer = _ConnectionWriter(SimpleNamespace(send=sent.append))
+        writer.write("tests/unit/test_a.py::test_x ")
+        writer.flush()
+        writer.write("PASSED\n")
+        writer.write("last")
+        writer.close()
+
+        assert sent == [
+            ("output", "tests/unit/test_a.py::test_x PASSED\n"),
+            ("output", "last"),
+        ]
+
+
+class TestReportRotation:
+    """Test cleanup of pytest JSON reports."""
+
+    def test_leftover_reports_are_rotated(self, tmp_path, monkeypatch):
+        """Test that reports from earlier sessions count toward the limit."""
+        monkeypatch.setenv("DM_REPORTS_DIR", str(tmp_path / "reports"))
+        executor = Executor(tmp_path)
+        reports = []
+        for index in range(KEPT_REPORTS + 3):
+            report = executor.reports_dir / f"pytest_report_{1000 + index}_1.json"
+            report.write_text("{}")
+            os.utime(report, (index, index))
+            reports.append(report)
+
+        executor._rotate_reports()
+
+        remaining = sorted(executor.reports_dir.glob("pytest_report_*.json"))
+        assert remaining == sorted(reports[-KEPT_REPORTS:])
+
+
+class TestTestSelection:
+    """Test mapping of changed files to test suites."""
+
+    def test_new_test_files_need_invalidation(self, tmp_path):
+        """Test that mapped test existence is cached until invalidated."""
+        executor = Executor(tmp_path)
+        source = Path("shared/models/blockchain_data.py")
+        assert executor.determine_tests_for_file(source) == []
+
+        (tmp_path / "tests" / "unit").mkdir(parents=True)
+        (tmp_path / "tests" / "unit" / "test_foundational_models.py").touch()
+        assert executor.determine_tests_for_file(source) == []
+
+        executor.invalidate_test_cache()
+        assert executor.determine_tests_for_file(source) == [
+            "tests/unit/test_foundational_models.py"
+        ]
+
+    def test_renamed_test_files_invalidate_cache(self, tmp_path):
+        """Test that a file renamed into a test name refreshes mapped tests."""
+        watcher = FileWatcher(project_root=tmp_path)
+        watcher.trigger_tests = lambda events: None
+        handler = watcher.file_handler
+        changes = []
+        handler.debounce_change = lambda file_path, event_type: changes.append(
+            handler.create_file_event(file_path, event_type)
+        )
+        source = Path("shared/models/blockchain_data.py")
+        draft = tmp_path / "tests" / "unit" / "draft.py"
+        draft.parent.mkdir(parents=True)
+        draft.touch()
+        assert watcher.test_executor.determine_tests_for_file(source) == []
+
+        renamed = draft.rename(draft.with_name("test_foundational_models.py"))
+        handler.dispatch(FileMovedEvent(str(draft), str(renamed)))
+        watcher.handle_file_changes(changes)
+
+        assert [change.event_type for change in changes] == ["deleted", "created"]
+        assert watcher.test_executor.determine_tests_for_file(source) == [
+            "tests/unit/test_foundational_models.py"
+        ]
@@ -249,6 +249,46 @@ class TestSharedModelsIntegration:
         reconstructed = EthereumDataSnapshot.model_validate_json_safe(json_data)
         assert reconstructed.eth_price_usd == data.eth_price_usd
 
+    def test_broadcast_dict(self):
+        """Test the frontend broadcast payload built from a snapshot."""
+        from shared.models.blockchain_data import (
+            ApiResponseTimes,
+            DataQuality,
+            EthereumDataSnapshot,
+        )
+
+        data = EthereumDataSnapshot(
+            timestamp=datetime.now().timestamp(),
+            epoch=100,
+            eth_price_usd=2500.0,
+            gas_price_gwei=25.0,
+            base_fee_gwei=20.0,
+            blob_space_utilization_percent=50.0,
+            block_fullness_percent=75.0,
+            data_quality=DataQuality(
+                price_data_fresh=True,
+                gas_data_fresh=True,
+                blob_data_fresh=True,
+                block_data_fresh=True,
+                overall_quality_score=0.9,
+            ),
+            api_response_times=ApiResponseTimes(
+                coinbase_ms=100.0, ethereum_rpc_ms=150.0, beacon_chain_ms=120.0
+            ),
+            data_sources={"eth_price": "live"},
+            block_number=21000000,
+        )
+
+        payload = data.to_broadcast_dict()
+        assert payload["eth_price_usd"] == 2500.0
+        assert payload["base_fee_gwei"] == 20.0
+        assert payload["block_number"] == 21000000
+        assert payload["epoch"] == 100
+        assert payload["data_sources"] == {"eth_price": "live"}
+
+        # Triggering block overrides the snapshot's own block number
+        assert data.to_broadcast_dict(21000001)["block_number"] == 21000001
+
 
 class TestSharedUtilities:
     """Test shared utilities and helper functions."""